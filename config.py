@@ -80,11 +80,26 @@ PROJECT_COLUMNS = ["Cesta", "Počet souborů", "Velikost", "Datum"]
 # Názvy sloupců pro skupiny podobných projektů
 GROUP_COLUMNS = ["Projekt", "Cesta", "Velikost", "Datum", "Podobnost", "Počet souborů", "Hash", "Poslední změna souboru"]
 
+# Indexy sloupců stromu skupin se zvýrazňovanými údaji (zjištěné jednou při importu)
+HASH_COLUMN = GROUP_COLUMNS.index("Hash") if "Hash" in GROUP_COLUMNS else -1
+SIZE_COLUMN = GROUP_COLUMNS.index("Velikost") if "Velikost" in GROUP_COLUMNS else -1
+FILE_COUNT_COLUMN = GROUP_COLUMNS.index("Počet souborů") if "Počet souborů" in GROUP_COLUMNS else -1
+LAST_FILE_MOD_COLUMN = GROUP_COLUMNS.index("Poslední změna souboru") if "Poslední změna souboru" in GROUP_COLUMNS else -1
+
 # Nastavení pro vyhledávání duplicit
 SIMILARITY_THRESHOLD = 0.7  # Práh podobnosti pro označení duplicity 
 
-# Seznam ignorovaných adresářů při výpočtu data poslední změny
-IGNORED_DIRS = [
+# Barva pro zvýraznění duplicitních projektů v tabulce
+DUPLICATE_COLOR = "#FFCCCC"
+
+# Hashovací algoritmus pro porovnání obsahu složek (název z hashlib)
+# "blake2b" je softwarově výrazně rychlejší než "sha256"; "sha256" lze zvolit,
+# pokud je potřeba shoda s dříve uloženými hashi
+FOLDER_HASH_ALGORITHM = "blake2b"
+
+# Množina ignorovaných adresářů při výpočtu data poslední změny
+# (frozenset - test příslušnosti při procházení složek je O(1))
+IGNORED_DIRS = frozenset([
     "venv", 
     ".venv", 
     "__pycache__", 
@@ -97,4 +112,4 @@ IGNORED_DIRS = [
     "dist",
     ".pytest_cache",
     ".mypy_cache"
-] 
\ No newline at end of file
+]) 
\ No newline at end of file
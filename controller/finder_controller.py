@@ -212,7 +212,7 @@ class FinderController(QObject):
         Args:
             settings (dict): Slovník s nastaveními
         """
-        self.finder_model.ignore_dirs = settings["ignored_dirs"]
+        self.finder_model.ignore_dirs = frozenset(settings["ignored_dirs"])
         self.finder_model.python_extensions = settings["python_extensions"]
     
     def open_folder(self, path):
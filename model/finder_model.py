@@ -12,7 +12,7 @@ import difflib
 from pathlib import Path
 from PySide6.QtCore import QObject, Signal
 from model.project_model import ProjectModel
-from config import IGNORED_DIRECTORIES, PYTHON_EXTENSIONS, SIMILARITY_THRESHOLD, PROJECT_ROOT_FILES, IGNORED_FILE_EXTENSIONS
+from config import IGNORED_DIRECTORIES, PYTHON_EXTENSIONS, SIMILARITY_THRESHOLD, PROJECT_ROOT_FILES, IGNORED_FILE_EXTENSIONS, FOLDER_HASH_ALGORITHM
 
 
 class FinderModel(QObject):
@@ -30,7 +30,7 @@ class FinderModel(QObject):
         """Inicializace modelu."""
         super().__init__()
         self.projects = []
-        self.ignore_dirs = IGNORED_DIRECTORIES
+        self.ignore_dirs = frozenset(IGNORED_DIRECTORIES)  # Množina - test příslušnosti je O(1)
         self.python_extensions = PYTHON_EXTENSIONS
         self.project_root_files = PROJECT_ROOT_FILES
         self.ignored_file_extensions = IGNORED_FILE_EXTENSIONS
@@ -176,15 +176,16 @@ class FinderModel(QObject):
                     if worker and not worker.running:
                         return
                         
+                    # Přeskočíme ignorované adresáře (levný test v množině
+                    # ještě před voláním stat v os.path.isdir)
+                    if item in self.ignore_dirs:
+                        continue
+                        
                     # Přeskočíme soubory, zajímají nás jen adresáře
                     item_path = os.path.join(path, item)
                     if not os.path.isdir(item_path):
                         continue
                         
-                    # Přeskočíme ignorované adresáře
-                    if item in self.ignore_dirs:
-                        continue
-                        
                     find_projects_recursive(
                         item_path,
                         is_root_dir=False,  # Podsložky již nejsou kořenovými složkami
@@ -218,6 +219,8 @@ class FinderModel(QObject):
             bool: True, pokud se uložení podařilo, jinak False
         """
         data = {
+            # Hashe složek jsou porovnatelné jen při shodném algoritmu
+            "folder_hash_algorithm": FOLDER_HASH_ALGORITHM,
             "python_projects": [project.to_dict() for project in self.projects]
         }
         
@@ -244,8 +247,9 @@ class FinderModel(QObject):
                 data = json.load(f)
             
             self.projects = []
+            folder_hash_algorithm = data.get("folder_hash_algorithm")
             for project_data in data.get("python_projects", []):
-                project = ProjectModel.from_dict(project_data)
+                project = ProjectModel.from_dict(project_data, folder_hash_algorithm)
                 self.projects.append(project)
                 self.project_found.emit(project)
             
@@ -349,7 +353,8 @@ class FinderModel(QObject):
         
         Returns:
             list: Seznam skupin duplicitních projektů, kde každá skupina obsahuje
-                  list projektů a slovník podobností
+                  list projektů, slovník podobností a slovník nejvyšších podobností
+                  jednotlivých projektů
         """
         # Nejprve získáme všechny duplicity a podobnosti
         duplicates, similarities = self.find_duplicates()
@@ -395,12 +400,39 @@ class FinderModel(QObject):
             # Aktualizujeme podobnosti pro konkrétní pár projektů
             found_group['similarities'][(project1, project2)] = similarity
             found_group['similarities'][(project2, project1)] = similarity
-        
+
+        # Pro každý projekt ve skupině předpočítáme nejvyšší podobnost k ostatním
+        # projektům skupiny, aby ji GUI nemuselo hledat procházením všech dvojic
+        for group in groups:
+            group['max_similarities'] = self._max_similarities(group['projects'], similarities)
+
         # Zarovnáme skupiny podle velikosti (počtu projektů)
         groups.sort(key=lambda x: len(x['projects']), reverse=True)
         
         return groups
-    
+
+    @staticmethod
+    def _max_similarities(group_projects, similarities):
+        """
+        Vypočítá nejvyšší podobnost každého projektu k ostatním projektům skupiny.
+
+        Args:
+            group_projects (list): Seznam projektů ve skupině
+            similarities (dict): Slovník podobností mezi dvojicemi projektů
+
+        Returns:
+            dict: Slovník {projekt: nejvyšší podobnost}
+        """
+        max_similarities = {}
+        for i, project1 in enumerate(group_projects):
+            for project2 in group_projects[i+1:]:
+                similarity = similarities.get((project1, project2), 0.0)
+                if similarity > max_similarities.get(project1, 0.0):
+                    max_similarities[project1] = similarity
+                if similarity > max_similarities.get(project2, 0.0):
+                    max_similarities[project2] = similarity
+        return max_similarities
+
     def find_identical_by_hash(self):
         """
         Najde projekty s identickým hashem, které jsou tedy 100% duplicitní.
@@ -409,7 +441,7 @@ class FinderModel(QObject):
             list: Seznam skupin identických projektů podle hashe
         """
         # Kontrola, zda máme vůbec projekty s hashem
-        projects_with_hash = [p for p in self.projects if hasattr(p, 'folder_hash') and p.folder_hash]
+        projects_with_hash = [p for p in self.projects if p.folder_hash]
         
         if not projects_with_hash:
             return []
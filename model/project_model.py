@@ -6,9 +6,41 @@ Obsahuje struktury dat a business logiku pro reprezentaci Python projektu.
 """
 
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
-from config import PROJECT_ROOT_FILES, IGNORED_FILE_EXTENSIONS, IGNORED_DIRS
+from config import PROJECT_ROOT_FILES, IGNORED_FILE_EXTENSIONS, IGNORED_DIRS, FOLDER_HASH_ALGORITHM
+from utils.hash_cache import folder_hash_cache
+from utils.file_scanner import iter_files
+import hashlib
+import fnmatch
+
+
+def new_folder_hasher():
+    """
+    Vytvoří hash objekt podle FOLDER_HASH_ALGORITHM.
+    
+    Returns:
+        Hash objekt z hashlib (BLAKE2b se zkráceným 256bitovým výstupem)
+    """
+    if FOLDER_HASH_ALGORITHM == "blake2b":
+        return hashlib.blake2b(digest_size=32)
+    return hashlib.new(FOLDER_HASH_ALGORITHM)
+
+
+def intern_hash(folder_hash):
+    """
+    Internuje hash složky. Stejné hashe jsou pak jediný objekt, takže jejich
+    porovnání při seskupování ve slovnících se rozhodne už shodou identity
+    bez porovnávání celých řetězců.
+    
+    Args:
+        folder_hash (str): Hash v hexadecimálním tvaru nebo None
+        
+    Returns:
+        str: Internovaný hash (None a prázdný řetězec se vrací beze změny)
+    """
+    return sys.intern(folder_hash) if folder_hash else folder_hash
 
 
 class ProjectModel:
@@ -36,6 +68,10 @@ class ProjectModel:
         self.folder_hash = None
         self.last_file_modified = None  # Datum poslední změny souboru v projektu
         
+        # Naposledy naformátované datum poslední změny souboru a hodnota, ze které vzniklo
+        self._formatted_last_file_modified = None
+        self._formatted_last_file_modified_key = None
+        
         # Načtení základních dat
         try:
             stat_info = os.stat(path)
@@ -152,12 +188,15 @@ class ProjectModel:
         return result
     
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, folder_hash_algorithm=None):
         """
         Vytvoří projekt ze slovníku.
         
         Args:
             data (dict): Slovník s informacemi o projektu
+            folder_hash_algorithm (str, optional): Algoritmus, kterým byl spočítán
+                hash v datech; hash jiného (i neuvedeného) algoritmu než
+                FOLDER_HASH_ALGORITHM se nenačte, protože není porovnatelný
             
         Returns:
             ProjectModel: Instance projektu
@@ -176,7 +215,8 @@ class ProjectModel:
         # Načtení skutečných hodnot
         project.real_size = data.get("real_size", None)
         project.real_file_count = data.get("real_file_count", None)
-        project.folder_hash = data.get("folder_hash", None)
+        if folder_hash_algorithm == FOLDER_HASH_ALGORITHM:
+            project.folder_hash = intern_hash(data.get("folder_hash", None))
         
         return project
     
@@ -217,7 +257,8 @@ class ProjectModel:
     def calculate_folder_hash(self, file_callback=None):
         """
         Vypočítá hash celé složky projektu pro přesné porovnání.
-        Používá kombinaci SHA-256 pro obsah souborů a metadata (cesty, velikosti, data změn).
+        Používá kombinaci hashe obsahu souborů (algoritmus FOLDER_HASH_ALGORITHM)
+        a metadat (cesty, velikosti, data změn).
         
         Args:
             file_callback: Volitelná callback funkce pro informování o zpracovávaných souborech
@@ -225,76 +266,194 @@ class ProjectModel:
         Returns:
             str: Hexadecimální řetězec hash hodnoty
         """
-        import hashlib
-        import fnmatch
-        
         if not os.path.exists(self.path) or not os.path.isdir(self.path):
             return None
-            
-        # Seznam všech souborů v adresáři
-        all_files = []
-        for root, _, files in os.walk(self.path):
-            for file in files:
-                # Přeskočení ignorovaných formátů souborů
-                if any(fnmatch.fnmatch(file.lower(), pattern) for pattern in self.ignored_file_extensions):
-                    continue
-                file_path = os.path.join(root, file)
-                all_files.append(file_path)
-        
-        # Seřazení souborů pro konzistentní hash
-        all_files.sort()
-        
-        # Vytvoření hash objektu
-        folder_hasher = hashlib.sha256()
         
-        # Zpracování každého souboru
-        for file_path in all_files:
+        # Pro nezměněnou složku použijeme hash z cache
+        stamp = folder_hash_cache.folder_stamp(self.path)
+        cached = folder_hash_cache.get(self.path, stamp)
+        if cached and cached[0]:
+            self.folder_hash = intern_hash(cached[0])
+            return self.folder_hash
+        
+        # Vytvoření hash objektu a bufferu pro čtení souborů
+        folder_hasher = new_folder_hasher()
+        read_buffer = memoryview(bytearray(1024 * 1024))
+        
+        # Zpracování každého souboru (seřazeně pro konzistentní hash)
+        for entry in self._collect_files():
+            # Přeskočení ignorovaných formátů souborů
+            if self._is_ignored_file(entry.name):
+                continue
             try:
-                # Relativní cesta k souboru (pro konzistenci napříč různými umístěními)
-                rel_path = os.path.relpath(file_path, self.path)
-                
                 # Informujeme o zpracovávaném souboru, pokud je poskytnut callback
                 if file_callback:
-                    file_callback(file_path)
+                    file_callback(entry.path)
                 
-                # Získání metadat souboru
-                stats = os.stat(file_path)
-                file_size = stats.st_size
-                file_mtime = int(stats.st_mtime)
-                
-                # Hash z metadat a cesty
-                metadata = f"{rel_path}|{file_size}|{file_mtime}"
-                folder_hasher.update(metadata.encode('utf-8'))
-                
-                # Pro menší soubory (<10MB) počítáme hash z obsahu
-                if file_size < 10 * 1024 * 1024:  # 10MB
-                    file_hasher = hashlib.sha256()
-                    with open(file_path, 'rb') as f:
-                        # Čteme soubor po blocích, abychom nespotřebovali příliš paměti
-                        for chunk in iter(lambda: f.read(4096), b''):
-                            file_hasher.update(chunk)
-                    # Přidáme hash obsahu souboru k celkovému hashi
-                    folder_hasher.update(file_hasher.digest())
-                else:
-                    # Pro větší soubory hash jen z prvních a posledních 1MB
-                    file_hasher = hashlib.sha256()
-                    with open(file_path, 'rb') as f:
-                        # Prvních 1MB
-                        file_hasher.update(f.read(1024 * 1024))
-                        # Přeskočíme do konce - velikost - 1MB
-                        f.seek(-1024 * 1024, 2)
-                        # Posledních 1MB
-                        file_hasher.update(f.read(1024 * 1024))
-                    # Přidáme hash částí souboru k celkovému hashi
-                    folder_hasher.update(file_hasher.digest())
+                self._update_folder_hash(folder_hasher, entry.path, entry.stat(), read_buffer)
             except (OSError, IOError, PermissionError):
                 # Ignorujeme soubory, ke kterým nemáme přístup
                 continue
         
         # Uložíme výsledný hash
-        self.folder_hash = folder_hasher.hexdigest()
+        self.folder_hash = intern_hash(folder_hasher.hexdigest())
+        folder_hash_cache.put(self.path, stamp, folder_hash=self.folder_hash)
         return self.folder_hash
     
+    def scan_all(self, file_callback=None):
+        """
+        Jediným průchodem složky zjistí skutečnou velikost, počet souborů,
+        datum poslední změny souboru a hash obsahu projektu.
+        Výsledky odpovídají samostatným výpočtům - velikost a počet souborů
+        zahrnují všechny soubory (jako calculate_real_folder_sizes), datum
+        nezahrnuje soubory v IGNORED_DIRS (jako get_last_file_modified)
+        a hash zahrnuje všechny soubory kromě ignorovaných formátů.
+        
+        Args:
+            file_callback: Volitelná callback funkce pro informování o zpracovávaných souborech
+        """
+        if not os.path.exists(self.path) or not os.path.isdir(self.path):
+            # Chybějící složka má nulové údaje stejně jako v get_folder_size
+            # a get_last_file_modified; hash bez obsahu nemá smysl
+            self.real_size = 0
+            self.real_file_count = 0
+            self.last_file_modified = 0
+            self.folder_hash = None
+            return
+        
+        # Hash a datum poslední změny pro nezměněnou složku známe z cache;
+        # velikost a počet souborů dává už průchod metadat pro značku složky
+        stamp = folder_hash_cache.folder_stamp(self.path)
+        cached = folder_hash_cache.get(self.path, stamp)
+        if cached and cached[0] and cached[1] is not None:
+            self.real_file_count, self.real_size = stamp[1], stamp[2]
+            self.folder_hash = intern_hash(cached[0])
+            self.last_file_modified = cached[1]
+            return
+        
+        folder_hasher = new_folder_hasher()
+        read_buffer = memoryview(bytearray(1024 * 1024))
+        total_size = 0
+        file_count = 0
+        latest_time = 0
+        in_ignored_dir = {}  # adresář -> zda leží v některém z IGNORED_DIRS
+        
+        for entry in self._collect_files():
+            file_path = entry.path
+            try:
+                stats = entry.stat()
+            except OSError:
+                continue  # Ignorujeme soubory, ke kterým nemáme přístup
+            
+            # Velikost a počet ze všech souborů
+            total_size += stats.st_size
+            file_count += 1
+            
+            # Datum změny jen mimo ignorované adresáře
+            directory = os.path.dirname(file_path)
+            ignored = in_ignored_dir.get(directory)
+            if ignored is None:
+                rel_dir = os.path.relpath(directory, self.path)
+                ignored = any(part in IGNORED_DIRS for part in rel_dir.split(os.sep))
+                in_ignored_dir[directory] = ignored
+            if not ignored and stats.st_mtime > latest_time:
+                latest_time = stats.st_mtime
+            
+            # Hash ze všech souborů kromě ignorovaných formátů
+            if self._is_ignored_file(entry.name):
+                continue
+            try:
+                if file_callback:
+                    file_callback(file_path)
+                self._update_folder_hash(folder_hasher, file_path, stats, read_buffer)
+            except (OSError, IOError, PermissionError):
+                continue  # Ignorujeme soubory, ke kterým nemáme přístup
+        
+        self.real_size = total_size
+        self.real_file_count = file_count
+        self.last_file_modified = latest_time
+        self.folder_hash = intern_hash(folder_hasher.hexdigest())
+        folder_hash_cache.put(self.path, stamp, folder_hash=self.folder_hash,
+                              last_file_modified=latest_time)
+    
+    def _collect_files(self):
+        """
+        Najde všechny soubory ve složce projektu seřazené podle cesty.
+        
+        Returns:
+            list: Seznam položek os.DirEntry
+        """
+        all_files = list(iter_files(self.path))
+        
+        # Seřazení souborů pro konzistentní hash
+        all_files.sort(key=lambda entry: entry.path)
+        return all_files
+    
+    def _is_ignored_file(self, file_name):
+        """
+        Zjistí, zda soubor patří mezi ignorované formáty (nezahrnuje se do hashe).
+        
+        Args:
+            file_name (str): Název souboru
+            
+        Returns:
+            bool: True, pokud se soubor do hashe nezahrnuje
+        """
+        return any(fnmatch.fnmatch(file_name.lower(), pattern) for pattern in self.ignored_file_extensions)
+    
+    def _update_folder_hash(self, folder_hasher, file_path, stats, read_buffer):
+        """
+        Přidá metadata a obsah souboru do hashe složky.
+        
+        Args:
+            folder_hasher: Hash objekt celé složky
+            file_path (str): Cesta k souboru
+            stats (os.stat_result): Metadata souboru
+            read_buffer (memoryview): Znovupoužitelný 1MB buffer pro čtení souborů
+        """
+        # Relativní cesta k souboru (pro konzistenci napříč různými umístěními)
+        rel_path = os.path.relpath(file_path, self.path)
+        file_size = stats.st_size
+        file_mtime = int(stats.st_mtime)
+        
+        # Hash z metadat a cesty
+        metadata = f"{rel_path}|{file_size}|{file_mtime}"
+        folder_hasher.update(metadata.encode('utf-8'))
+        
+        # Pro menší soubory (<10MB) počítáme hash z obsahu
+        if file_size < 10 * 1024 * 1024:  # 10MB
+            file_hasher = new_folder_hasher()
+            if file_size <= 1024 * 1024:
+                # Malé soubory (v projektech naprostá většina) načteme jedním čtením
+                # bez bufferu - odpadá režie bloků i kopírování přes BufferedReader
+                with open(file_path, 'rb', buffering=0) as f:
+                    file_hasher.update(f.read())
+            else:
+                with open(file_path, 'rb') as f:
+                    # Čteme soubor po 1MB blocích do stále stejného bufferu,
+                    # takže se pro každý blok nealokuje nový objekt bytes
+                    while True:
+                        size = f.readinto(read_buffer)
+                        if not size:
+                            break
+                        file_hasher.update(read_buffer[:size])
+            # Přidáme hash obsahu souboru k celkovému hashi
+            folder_hasher.update(file_hasher.digest())
+        else:
+            # Pro větší soubory hash jen z prvních a posledních 1MB
+            file_hasher = new_folder_hasher()
+            with open(file_path, 'rb') as f:
+                # Prvních 1MB
+                size = f.readinto(read_buffer)
+                file_hasher.update(read_buffer[:size])
+                # Přeskočíme do konce - velikost - 1MB
+                f.seek(-1024 * 1024, 2)
+                # Posledních 1MB
+                size = f.readinto(read_buffer)
+                file_hasher.update(read_buffer[:size])
+            # Přidáme hash částí souboru k celkovému hashi
+            folder_hasher.update(file_hasher.digest())
+    
     def get_folder_size(self):
         """
         Získání velikosti složky.
@@ -337,21 +496,19 @@ class ProjectModel:
         """
         if self.last_file_modified is not None:
             return self.last_file_modified
-            
+        
+        # Bez cache - značka složky prochází i IGNORED_DIRS, a byla by tak
+        # dražší než samotný průchod, který do nich nevstupuje
         try:
             latest_time = 0
-            for dirpath, dirnames, filenames in os.walk(self.path):
-                # Odstranění ignorovaných adresářů z procházení
-                dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS]
-                
-                for f in filenames:
-                    fp = os.path.join(dirpath, f)
-                    try:
-                        mtime = os.path.getmtime(fp)
-                        if mtime > latest_time:
-                            latest_time = mtime
-                    except (OSError, FileNotFoundError):
-                        pass  # Ignorujeme soubory, ke kterým nemáme přístup
+            # Do ignorovaných adresářů se při procházení vůbec nevstupuje
+            for entry in iter_files(self.path, IGNORED_DIRS):
+                try:
+                    mtime = entry.stat().st_mtime
+                    if mtime > latest_time:
+                        latest_time = mtime
+                except (OSError, FileNotFoundError):
+                    pass  # Ignorujeme soubory, ke kterým nemáme přístup
             
             self.last_file_modified = latest_time
             return latest_time
@@ -362,14 +519,26 @@ class ProjectModel:
     def get_formatted_last_file_modified(self):
         """
         Formátované datum poslední úpravy libovolného souboru v projektu.
+        Naformátovaný text se uloží a znovu se vytváří, jen když se datum změní.
         
         Returns:
-            str: Datum poslední změny ve formátu DD.MM.YYYY HH:MM
+            str: Datum poslední změny ve formátu DD.MM.YYYY HH:MM ("-", pokud není známé)
         """
         last_file_time = self.get_last_file_modified()
-        if last_file_time == 0:
-            return "-"
-        return datetime.fromtimestamp(last_file_time).strftime("%d.%m.%Y %H:%M")
+        if last_file_time == self._formatted_last_file_modified_key:
+            return self._formatted_last_file_modified
+        
+        if not last_file_time:
+            formatted = "-"
+        else:
+            try:
+                formatted = datetime.fromtimestamp(last_file_time).strftime("%d.%m.%Y %H:%M")
+            except (OverflowError, OSError, ValueError):
+                formatted = "-"  # Časová známka mimo rozsah platných dat
+        
+        self._formatted_last_file_modified = formatted
+        self._formatted_last_file_modified_key = last_file_time
+        return formatted
     
     def check_feature(self, feature_name):
         """
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Společné nastavení testů - aplikace Qt bez displeje.
+"""
+
+import os
+import sys
+import types
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Kořen repozitáře musí být importovatelný jako v main.py
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from PySide6.QtWidgets import QApplication
+
+# Barevné téma pro testy (hodnoty odpovídají klíčům, které view používá)
+TEST_THEME = {
+    "tree_header_background": "#E0E0E0",
+    "similar_color": "#AAFFAA",
+    "same_hash_color": "#C8F7C5",
+    "same_size_color": "#FFE0B2",
+    "same_files_color": "#BBDEFB",
+    "same_date_color": "#E1BEE7",
+    "selected_item_text": "#000000",
+    "selected_item_background": "#CCE8FF",
+    "highlight_background": "#808080",
+}
+
+
+def _ensure_theme_module():
+    """
+    Modul resources.style.themes není součástí tohoto stromu; pokud chybí,
+    zaregistruje se pro testy jednoduchý ThemeManager s pevným tématem.
+    """
+    try:
+        import resources.style.themes  # noqa: F401
+        return
+    except ImportError:
+        pass
+    
+    class ThemeManager:
+        @staticmethod
+        def load_current_theme():
+            return "test"
+        
+        @staticmethod
+        def get_theme(name):
+            return dict(TEST_THEME)
+    
+    module = types.ModuleType("resources.style.themes")
+    module.ThemeManager = ThemeManager
+    sys.modules["resources.style.themes"] = module
+
+
+_ensure_theme_module()
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Instance QApplication sdílená všemi testy."""
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+@pytest.fixture
+def view(qapp):
+    """
+    Komponenta se seznamem projektů. Po testu se zpracují odložená volání
+    (QTimer.singleShot), aby nezůstala viset do ukončení interpretu.
+    """
+    from view.project_list_view import ProjectListView
+    
+    widget = ProjectListView()
+    yield widget
+    widget._clear_groups_tree()
+    qapp.processEvents()
+    widget.deleteLater()
+    qapp.processEvents()
+
+
+@pytest.fixture
+def make_projects(tmp_path):
+    """Vytvoří projekty ve skutečných dočasných složkách."""
+    from model.project_model import ProjectModel
+    
+    def factory(count, prefix="projekt"):
+        projects = []
+        for i in range(count):
+            folder = tmp_path / f"{prefix}_{i:05d}"
+            folder.mkdir()
+            (folder / "main.py").write_text(f"print({i})\n", encoding="utf-8")
+            # Stejně jako FinderModel projekt po vytvoření analyzuje
+            project = ProjectModel(str(folder))
+            project._analyze_project()
+            projects.append(project)
+        return projects
+    
+    return factory
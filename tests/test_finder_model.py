@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testy modelu pro vyhledávání projektů.
+"""
+
+import json
+
+from config import FOLDER_HASH_ALGORITHM
+from model.finder_model import FinderModel
+
+
+def _saved_model(make_projects, output_file):
+    """Uloží model se dvěma projekty se známým hashem do JSON souboru."""
+    model = FinderModel()
+    model.projects = make_projects(2)
+    for project in model.projects:
+        project.folder_hash = "ab" * 32
+    assert model.save_to_json(str(output_file))
+    return model
+
+
+def test_json_round_trip_keeps_hashes_of_same_algorithm(make_projects, tmp_path):
+    """Export uvádí algoritmus hashe a při shodě se hashe načtou."""
+    output_file = tmp_path / "projekty.json"
+    _saved_model(make_projects, output_file)
+    assert json.loads(output_file.read_text(encoding="utf-8"))["folder_hash_algorithm"] == FOLDER_HASH_ALGORITHM
+    
+    loaded = FinderModel()
+    assert loaded.load_from_json(str(output_file))
+    assert [project.folder_hash for project in loaded.projects] == ["ab" * 32] * 2
+
+
+def test_json_import_drops_hashes_of_other_algorithm(make_projects, tmp_path):
+    """Hashe jiného nebo neuvedeného algoritmu se při načtení zahodí."""
+    output_file = tmp_path / "projekty.json"
+    _saved_model(make_projects, output_file)
+    data = json.loads(output_file.read_text(encoding="utf-8"))
+    
+    for algorithm in ("md5", None):
+        if algorithm is None:
+            data.pop("folder_hash_algorithm")
+        else:
+            data["folder_hash_algorithm"] = algorithm
+        output_file.write_text(json.dumps(data), encoding="utf-8")
+        
+        loaded = FinderModel()
+        assert loaded.load_from_json(str(output_file))
+        assert [project.folder_hash for project in loaded.projects] == [None, None]
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testy cache hashů složek.
+"""
+
+import os
+
+from utils.hash_cache import FolderHashCache
+
+
+def _make_tree(root):
+    """Vytvoří projekt se souborem ve druhé úrovni podadresářů."""
+    deep_dir = root / "balicek" / "modul"
+    deep_dir.mkdir(parents=True)
+    deep_file = deep_dir / "jadro.py"
+    deep_file.write_text("x = 1\n", encoding="utf-8")
+    os.utime(deep_file, (1_000_000, 1_000_000))
+    return deep_file
+
+
+def test_deep_edit_invalidates_cached_hash(tmp_path):
+    """Úprava souboru ve druhé úrovni podadresářů zneplatní uložený hash."""
+    project_dir = tmp_path / "projekt"
+    deep_file = _make_tree(project_dir)
+    cache = FolderHashCache(str(tmp_path / "cache.json"))
+    
+    stamp = cache.folder_stamp(str(project_dir))
+    cache.put(str(project_dir), stamp, folder_hash="abc")
+    assert cache.get(str(project_dir), cache.folder_stamp(str(project_dir))) == ("abc", None)
+    
+    # Novější čas změny i jiná velikost; adresáře nad souborem se nemění
+    deep_file.write_text("x = 12\n", encoding="utf-8")
+    os.utime(deep_file, (2_000_000_000, 2_000_000_000))
+    
+    assert cache.get(str(project_dir), cache.folder_stamp(str(project_dir))) is None
+
+
+def test_stamp_survives_save_and_load(tmp_path):
+    """Značka uložená do JSON odpovídá po načtení nové instance cache."""
+    project_dir = tmp_path / "projekt"
+    _make_tree(project_dir)
+    cache_file = str(tmp_path / "cache.json")
+    cache = FolderHashCache(cache_file)
+    cache.put(str(project_dir), cache.folder_stamp(str(project_dir)), folder_hash="abc")
+    assert cache.save()
+    
+    reloaded = FolderHashCache(cache_file)
+    assert reloaded.get(str(project_dir), reloaded.folder_stamp(str(project_dir))) == ("abc", None)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testy komponenty se seznamem projektů (strom skupin).
+"""
+
+import os
+
+from PySide6.QtCore import Qt
+
+from model.project_model import ProjectModel
+from utils.folder_calculator import ProjectScanTask
+from view.project_list_view import ProjectTableModel, HIGH_SIMILARITY_BRUSH, POPULATE_CHUNK_SIZE, SIZE_COLUMN
+
+
+def _child_names(group_item):
+    """Vrací texty prvního sloupce všech potomků položky."""
+    return [group_item.child(i).text(0) for i in range(group_item.childCount())]
+
+
+def test_show_all_projects_with_sorting_enabled(view, make_projects):
+    """Naplnění stromu se zapnutým řazením podle textového sloupce nesmí zacyklit __lt__."""
+    assert view.groups_tree.isSortingEnabled()
+    view.groups_tree.sortByColumn(0, Qt.AscendingOrder)
+    
+    projects = make_projects(5)
+    view.show_all_projects(list(reversed(projects)))
+    
+    group_item = view.groups_tree.topLevelItem(0)
+    names = _child_names(group_item)
+    assert names == sorted(names)
+    assert len(names) == 5
+
+
+def test_show_duplicate_groups_with_sorting_enabled(view, make_projects):
+    """Zobrazení skupin duplicit se zapnutým řazením projde bez rekurze."""
+    view.groups_tree.sortByColumn(0, Qt.AscendingOrder)
+    projects = make_projects(4)
+    groups = [
+        {"projects": [projects[1], projects[0]], "max_similarities": {}},
+        {"projects": [projects[3], projects[2]], "max_similarities": {}},
+    ]
+    
+    view.show_duplicate_groups(groups)
+    
+    assert view.groups_tree.topLevelItemCount() >= 2
+    for index in range(view.groups_tree.topLevelItemCount()):
+        names = _child_names(view.groups_tree.topLevelItem(index))
+        assert names == sorted(names)
+
+
+def test_sort_by_numeric_column_uses_project_values(view, make_projects):
+    """Číselné sloupce se řadí podle hodnot projektu, ne podle textu."""
+    projects = make_projects(3)
+    for project, size in zip(projects, (2048, 10, 300)):
+        project.real_size = size
+    view.show_all_projects(projects)
+    
+    view.groups_tree.sortByColumn(2, Qt.AscendingOrder)
+    group_item = view.groups_tree.topLevelItem(0)
+    sizes = [group_item.child(i).data(0, Qt.UserRole).real_size for i in range(group_item.childCount())]
+    assert sizes == [10, 300, 2048]
+
+
+def test_scan_of_deleted_folder_finishes_batch(view, make_projects, tmp_path):
+    """Projekt, jehož složka mezitím zmizela, dávku výpočtu nezablokuje."""
+    projects = make_projects(2)
+    view.show_all_projects(projects)
+    group_item = view.groups_tree.topLevelItem(0)
+    pairs = [(group_item.child(i), group_item.child(i).data(0, Qt.UserRole)) for i in range(2)]
+    
+    missing = pairs[0][1]
+    for file_path in os.listdir(missing.path):
+        os.remove(os.path.join(missing.path, file_path))
+    os.rmdir(missing.path)
+    
+    batch = {"remaining": 2, "projects": pairs, "message": "Hotovo", "notify_controller": False}
+    for item, project in pairs:
+        task = ProjectScanTask(item, project)
+        task.batch = batch
+        task.run()
+        view._on_project_scan_finished(task)
+    
+    assert batch["remaining"] == 0
+    assert view.status_label.text() == "Hotovo"
+    assert missing.real_size == 0
+
+
+def test_display_error_does_not_stall_batch(view, make_projects):
+    """Libovolná výjimka při zobrazení údajů se ohlásí a dávka se přesto dokončí."""
+    projects = make_projects(2)
+    view.show_all_projects(projects)
+    group_item = view.groups_tree.topLevelItem(0)
+    pairs = [(group_item.child(i), group_item.child(i).data(0, Qt.UserRole)) for i in range(2)]
+    
+    broken = pairs[0][1]
+    broken.real_size = "neplatná velikost"
+    
+    batch = {"remaining": 1, "projects": pairs[:1], "message": "Hotovo", "notify_controller": False}
+    task = ProjectScanTask(*pairs[0])
+    task.batch = batch
+    view._on_project_scan_finished(task)
+    
+    assert batch["remaining"] == 0
+    assert view.status_label.text() == "Hotovo"
+
+
+def _finish_population(view):
+    """Dokončí postupné plnění stromu bez čekání na smyčku událostí."""
+    while view._population is not None:
+        view._populate_step(view._population)
+
+
+def test_refresh_during_fill_keeps_filling_in_chunks(view, tmp_path):
+    """Opakované zobrazení během plnění aktualizuje jen existující řádky a plnění pokračuje."""
+    count = POPULATE_CHUNK_SIZE * 2 + 10
+    projects = [ProjectModel(str(tmp_path / f"p{i:05d}")) for i in range(count)]
+    view.show_all_projects(projects)
+    group_item = view.groups_tree.topLevelItem(0)
+    assert group_item.childCount() == POPULATE_CHUNK_SIZE
+    
+    # Druhé zobrazení: jeden projekt zmizí, jeden přibude a dva mají shodnou velikost
+    removed = projects[0]
+    added = ProjectModel(str(tmp_path / "novy"))
+    projects = projects[1:] + [added]
+    projects[0].real_size = projects[1].real_size = 4096
+    view.show_all_projects(projects)
+    
+    assert group_item.childCount() == POPULATE_CHUNK_SIZE - 1
+    assert view._population is not None
+    assert removed.path not in view._item_by_path
+    refreshed_item = view._item_by_path[projects[0].path]
+    assert refreshed_item.background(SIZE_COLUMN) == view._theme_brushes["same_size_color"]
+    
+    _finish_population(view)
+    assert group_item.childCount() == count
+    assert set(view._item_by_path) == {project.path for project in projects}
+
+
+def test_recolor_clears_highlight_of_value_that_became_unique(view, tmp_path):
+    """Zvýraznění z naplnění stromu zmizí, když hodnotu přestanou sdílet dva projekty."""
+    projects = [ProjectModel(str(tmp_path / f"p{i}")) for i in range(3)]
+    for project in projects:
+        project.real_size = 100
+    view.show_all_projects(projects)
+    items = [view._item_by_path[project.path] for project in projects]
+    same_size_brush = view._theme_brushes["same_size_color"]
+    assert all(item.background(SIZE_COLUMN) == same_size_brush for item in items)
+    
+    # Po výpočtu mají všechny projekty různou velikost
+    for size, project in enumerate(projects, 1):
+        project.real_size = size
+    view._recolor_projects(list(zip(items[:1], projects[:1])))
+    
+    assert all(item.background(SIZE_COLUMN) != same_size_brush for item in items)
+
+
+def test_reload_theme_replaces_legend_in_place(view):
+    """Nová legenda zaujme místo původní ve vnořeném layoutu."""
+    old_legend = view.color_legend
+    layout = view._legend_layout
+    index = layout.indexOf(old_legend)
+    
+    view.reload_theme()
+    
+    assert view.color_legend is not old_legend
+    assert layout.indexOf(view.color_legend) == index
+    assert layout.indexOf(old_legend) == -1
+
+
+def test_set_duplicates_stores_a_set(qapp):
+    """Indexy duplicit předané jako seznam se uloží jako množina."""
+    model = ProjectTableModel()
+    model.set_duplicates([1, 3])
+    model.set_duplicates([3, 4])
+    
+    assert model.duplicates == {3, 4}
+
+
+def test_recolor_keeps_row_highlight_of_similar_group(view, tmp_path):
+    """Přebarvení jednoho projektu nesmaže zvýraznění řádků skupiny s podobností nad 99 %."""
+    projects = [ProjectModel(str(tmp_path / f"p{i}")) for i in range(3)]
+    for size, project in enumerate(projects, 1):
+        project.real_size = size
+    projects[0].real_size = projects[1].real_size = 100
+    view.show_duplicate_groups([{
+        "projects": projects,
+        "max_similarities": {project: 1.0 for project in projects},
+    }])
+    group_item = view.groups_tree.topLevelItem(0)
+    items = {group_item.child(i).data(0, Qt.UserRole): group_item.child(i) for i in range(3)}
+    same_size_brush = view._theme_brushes["same_size_color"]
+    assert items[projects[0]].background(SIZE_COLUMN) == same_size_brush
+    
+    # Po výpočtu už velikost nesdílí žádné dva projekty
+    projects[0].real_size = 50
+    view._recolor_projects([(items[projects[0]], projects[0])])
+    
+    for item in items.values():
+        assert item.background(SIZE_COLUMN) == HIGH_SIMILARITY_BRUSH
+
+
+def test_calculate_all_data_action_does_not_report_done_early(view, make_projects, qapp):
+    """Akce ohlásí dokončení až po doběhnutí úloh na pozadí."""
+    from PySide6.QtCore import QThreadPool
+    
+    view.show_all_projects(make_projects(2))
+    group_item = view.groups_tree.topLevelItem(0)
+    view.groups_tree.setCurrentItem(group_item)
+    
+    view.calculate_all_data_action()
+    assert view.status_label.text() != "Výpočet všech údajů dokončen."
+    
+    QThreadPool.globalInstance().waitForDone()
+    qapp.processEvents()
+    assert view.status_label.text() == "Všechny údaje byly vypočítány pro skupinu projektů"
+    view._recolor_timer.stop()
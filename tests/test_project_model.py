@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testy modelu projektu.
+"""
+
+from model.project_model import ProjectModel
+from utils.file_scanner import scan_folder_size
+
+
+def test_scan_all_of_missing_folder_sets_zero_sizes(tmp_path):
+    """Chybějící složka dostane nulové údaje místo ponechaných None."""
+    project = ProjectModel(str(tmp_path / "neexistuje"))
+    
+    project.scan_all()
+    
+    assert project.real_size == 0
+    assert project.real_file_count == 0
+    assert project.last_file_modified == 0
+    assert project.folder_hash is None
+
+
+def test_scan_all_size_matches_real_folder_size_action(tmp_path):
+    """Velikost a počet souborů ze scan_all znamenají totéž co samostatný výpočet velikostí."""
+    project_dir = tmp_path / "projekt"
+    (project_dir / "venv" / "lib").mkdir(parents=True)
+    (project_dir / "main.py").write_text("print(1)\n", encoding="utf-8")
+    (project_dir / "venv" / "lib" / "balik.py").write_text("x = 1\n" * 10, encoding="utf-8")
+    project = ProjectModel(str(project_dir))
+    
+    project.scan_all()
+    
+    assert (project.real_size, project.real_file_count) == scan_folder_size(str(project_dir))
+    assert project.real_file_count == 2
+
+
+def test_scan_all_cache_hit_keeps_size_and_count(tmp_path):
+    """Opakovaný výpočet nezměněné složky (z cache) dá stejné údaje jako první."""
+    project_dir = tmp_path / "projekt"
+    (project_dir / "venv").mkdir(parents=True)
+    (project_dir / "main.py").write_text("print(1)\n", encoding="utf-8")
+    (project_dir / "venv" / "balik.py").write_text("x = 1\n", encoding="utf-8")
+    first = ProjectModel(str(project_dir))
+    first.scan_all()
+    
+    second = ProjectModel(str(project_dir))
+    second.scan_all()
+    
+    assert (second.real_size, second.real_file_count, second.folder_hash, second.last_file_modified) == \
+        (first.real_size, first.real_file_count, first.folder_hash, first.last_file_modified)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Utility pro rychlé procházení souborů ve složkách projektu.
+Používá os.scandir, jehož položky (DirEntry) nesou metadata načtená už při
+čtení adresáře, takže pro každý soubor odpadá samostatné volání stat.
+"""
+
+import os
+
+
+def iter_files(path, ignored_dirs=()):
+    """
+    Projde rekurzivně složku a vrací všechny soubory v ní.
+
+    Args:
+        path (str): Cesta ke složce
+        ignored_dirs (Container): Názvy adresářů, do kterých se nevstupuje
+
+    Yields:
+        os.DirEntry: Položka pro každý nalezený soubor
+    """
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in ignored_dirs:
+                                stack.append(entry.path)
+                        elif not entry.is_dir():
+                            # Odkazy na adresáře se (stejně jako v os.walk) nenásledují
+                            yield entry
+                    except OSError:
+                        continue  # Ignorujeme položky, ke kterým nemáme přístup
+        except OSError:
+            continue  # Ignorujeme adresáře, které nelze přečíst
+
+
+def scan_folder_size(path, ignored_dirs=()):
+    """
+    Zjistí celkovou velikost a počet souborů ve složce.
+
+    Args:
+        path (str): Cesta ke složce
+        ignored_dirs (Container): Názvy adresářů, do kterých se nevstupuje
+
+    Returns:
+        tuple: (celková velikost v bajtech, počet souborů)
+    """
+    # Velikosti se jen sbírají do seznamu; sečtení i spočítání pak proběhne
+    # v C (sum, len) místo aritmetiky interpretované pro každý soubor
+    sizes = []
+    append = sizes.append
+    for entry in iter_files(path, ignored_dirs):
+        try:
+            append(entry.stat().st_size)
+        except OSError:
+            continue  # Ignorujeme soubory, ke kterým nemáme přístup
+    return sum(sizes), len(sizes)
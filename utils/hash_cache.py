@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache hashů obsahu složek a dat poslední změny souborů.
+Záznamy jsou klíčované cestou ke složce a značkou z metadat celého jejího stromu,
+takže opakovaný výpočet pro nezměněný projekt nemusí znovu číst obsah souborů.
+Cache se ukládá do JSON souboru v datovém adresáři aplikace.
+"""
+
+import os
+import threading
+from PySide6.QtCore import QStandardPaths
+
+from config import FOLDER_HASH_ALGORITHM
+from utils.json_handler import save_to_json, load_from_json
+
+# Název souboru s cache v datovém adresáři aplikace
+HASH_CACHE_FILE = "folder_hash_cache.json"
+
+
+class FolderHashCache:
+    """Perzistentní cache výsledků výpočtů nad obsahem složek projektů."""
+    
+    def __init__(self, filename=None):
+        """
+        Inicializace cache.
+        
+        Args:
+            filename (str, optional): Cesta k souboru s cache (výchozí je datový adresář aplikace)
+        """
+        self.filename = filename
+        self._entries = {}  # cesta -> [značka složky, hash, poslední změna souboru]
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()  # Cache se používá i z úloh v QThreadPool
+    
+    @staticmethod
+    def folder_stamp(path):
+        """
+        Vypočítá značku složky rekurzivním průchodem jen přes metadata (bez čtení
+        obsahu) - nejnovější čas změny souboru či adresáře, počet souborů
+        a jejich celkovou velikost. Zachytí přidání, smazání, přejmenování
+        i úpravu souboru v libovolné hloubce, a to i v IGNORED_DIRS, protože
+        hash zahrnuje všechny soubory. Soubory prochází stejně jako
+        scan_folder_size bez ignorovaných adresářů, takže počet a velikost ze
+        značky jsou přímo skutečný počet souborů a velikost složky.
+        
+        Args:
+            path (str): Cesta ke složce
+        
+        Returns:
+            list: [nejnovější čas změny, počet souborů, celková velikost]
+                  nebo None, pokud složku nelze přečíst
+        """
+        try:
+            latest = os.stat(path).st_mtime
+        except OSError:
+            return None
+        
+        file_count = 0
+        total_size = 0
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                                stats = entry.stat(follow_symlinks=False)
+                            elif not entry.is_dir():
+                                # Odkazy na adresáře se (stejně jako v iter_files) nenásledují
+                                stats = entry.stat()
+                                file_count += 1
+                                total_size += stats.st_size
+                            else:
+                                continue
+                        except OSError:
+                            continue  # Ignorujeme položky, ke kterým nemáme přístup
+                        if stats.st_mtime > latest:
+                            latest = stats.st_mtime
+            except OSError:
+                continue  # Ignorujeme adresáře, které nelze přečíst
+        # Seznam (ne n-tice), aby se značka po uložení do JSON a načtení rovnala
+        return [latest, file_count, total_size]
+    
+    def get(self, path, stamp):
+        """
+        Vrátí uložený záznam pro složku, pokud odpovídá značce složky.
+        
+        Args:
+            path (str): Cesta ke složce
+            stamp (list): Aktuální značka složky z folder_stamp
+        
+        Returns:
+            tuple: (hash, poslední změna souboru) - hodnoty mohou být None,
+                   nebo None, pokud platný záznam neexistuje
+        """
+        if stamp is None:
+            return None
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(path)
+        if entry is None or entry[0] != stamp:
+            return None
+        return entry[1], entry[2]
+    
+    def put(self, path, stamp, folder_hash=None, last_file_modified=None):
+        """
+        Uloží výsledek výpočtu pro složku. Hodnoty None zachovají dříve uložený
+        údaj, pokud patří ke stejné značce složky.
+        
+        Args:
+            path (str): Cesta ke složce
+            stamp (list): Značka složky z folder_stamp, pro kterou výsledek platí
+            folder_hash (str, optional): Hash obsahu složky
+            last_file_modified (float, optional): Datum poslední změny souboru
+        """
+        if stamp is None:
+            return
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == stamp:
+                if folder_hash is None:
+                    folder_hash = entry[1]
+                if last_file_modified is None:
+                    last_file_modified = entry[2]
+            self._entries[path] = [stamp, folder_hash, last_file_modified]
+            self._dirty = True
+    
+    def save(self):
+        """
+        Uloží cache do souboru, pokud se od načtení změnila.
+        
+        Returns:
+            bool: True, pokud se uložení podařilo nebo nebylo potřeba
+        """
+        with self._lock:
+            if not self._dirty:
+                return True
+            data = {"algorithm": FOLDER_HASH_ALGORITHM, "entries": self._entries}
+            if save_to_json(data, self._cache_file(), indent=None):
+                self._dirty = False
+                return True
+            return False
+    
+    def _ensure_loaded(self):
+        """Načte cache ze souboru při prvním použití (volá se pod zámkem)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        
+        data, error = load_from_json(self._cache_file())
+        if error or not isinstance(data, dict):
+            return
+        # Hashe spočítané jiným algoritmem nejsou porovnatelné
+        if data.get("algorithm") != FOLDER_HASH_ALGORITHM:
+            return
+        self._entries = data.get("entries", {})
+    
+    def _cache_file(self):
+        """Vrátí cestu k souboru s cache."""
+        if self.filename is None:
+            directory = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+            self.filename = os.path.join(directory, HASH_CACHE_FILE)
+        return self.filename
+
+
+# Sdílená instance cache pro celou aplikaci
+folder_hash_cache = FolderHashCache()
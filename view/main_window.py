@@ -16,6 +16,7 @@ from view.project_list_view import ProjectListView
 from view.settings_dialog import SettingsDialog
 from view.help_dialog import HelpDialog
 from config import GUI_TITLE, GUI_WIDTH, GUI_HEIGHT
+from utils.hash_cache import folder_hash_cache
 
 
 class MainWindow(QMainWindow):
@@ -206,4 +207,14 @@ class MainWindow(QMainWindow):
         Args:
             message (str): Zpráva k zobrazení
         """
-        self.info_label.setText(message) 
\ No newline at end of file
+        self.info_label.setText(message)
+    
+    def closeEvent(self, event):
+        """
+        Při zavření okna uloží cache hashů složek pro příští spuštění.
+        
+        Args:
+            event: Událost zavření okna
+        """
+        folder_hash_cache.save()
+        super().closeEvent(event) 
\ No newline at end of file
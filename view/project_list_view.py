@@ -8,13 +8,285 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QTableView, QHeaderView, 
     QAbstractItemView, QMenu, QLabel, QSplitter, QTreeWidget, QTreeWidgetItem, QHBoxLayout, QFrame
 )
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
-from PySide6.QtGui import QAction, QColor
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QTimer, QThreadPool, Slot
+from PySide6.QtGui import QAction, QColor, QBrush
+from collections import Counter, defaultdict
+from operator import attrgetter, itemgetter
+from contextlib import contextmanager
 import os
 
-from config import PROJECT_COLUMNS, GROUP_COLUMNS
+from config import (PROJECT_COLUMNS, GROUP_COLUMNS, DUPLICATE_COLOR,
+                    HASH_COLUMN, SIZE_COLUMN, FILE_COUNT_COLUMN, LAST_FILE_MOD_COLUMN)
 from resources.style.themes import ThemeManager
-from utils.folder_calculator import calculate_real_folder_sizes, _update_coloring_after_calculation, calculate_folder_hashes, calculate_last_file_modified
+from utils.folder_calculator import calculate_real_folder_sizes, calculate_folder_hashes, calculate_last_file_modified, ProjectScanTask, make_hash_progress_callback
+
+# Barva pro zvýraznění duplicitních projektů v tabulce
+DUPLICATE_QCOLOR = QColor(DUPLICATE_COLOR)
+
+# Světle zelená výplň řádku pro projekty s podobností 99 % a více
+HIGH_SIMILARITY_BRUSH = QBrush(QColor("#AAFFAA"))
+
+# Prázdný štětec - buňka bez zvýraznění
+NO_BRUSH = QBrush()
+
+# Počet položek vložených do stromu během jednoho průchodu smyčkou událostí
+POPULATE_CHUNK_SIZE = 500
+
+# Prodleva (ms), během níž se požadavky na přebarvení po výpočtech slučují
+RECOLOR_DELAY_MS = 100
+
+# Role dat položky skupiny všech projektů, jejíž obsah se vytvoří až při rozbalení
+LAZY_GROUP_ROLE = Qt.UserRole + 2
+ALL_PROJECTS_PLACEHOLDER = "all_projects_placeholder"
+
+# Klíče barev tématu, pro které se při načtení tématu připraví QBrush
+THEME_COLOR_KEYS = (
+    "tree_header_background",
+    "similar_color",
+    "same_hash_color",
+    "same_size_color",
+    "same_files_color",
+    "same_date_color",
+)
+
+# Třída AppController načtená při prvním použití (přímý import by byl cyklický)
+_app_controller_class = None
+
+
+def _get_app_controller():
+    """
+    Vrací třídu AppController.
+    Modul controlleru importuje toto view, proto se import provádí až při prvním
+    použití a výsledek se uloží pro další volání.
+    
+    Returns:
+        type: Třída AppController
+    """
+    global _app_controller_class
+    if _app_controller_class is None:
+        from controller.app_controller import AppController
+        _app_controller_class = AppController
+    return _app_controller_class
+
+
+def _duplicate_values(values):
+    """
+    Vrací množinu hodnot, které se v posloupnosti vyskytují alespoň dvakrát.
+    Hodnoty None a prázdné řetězce (chybějící údaj) se ignorují. Pokud se
+    hodnoty předají jako map(attrgetter(...)), proběhne celé počítání v C
+    bez smyčky interpretované pro každý projekt.
+    
+    Args:
+        values (iterable): Posloupnost porovnávaných hodnot
+        
+    Returns:
+        set: Množina duplicitních hodnot
+    """
+    counts = Counter(values)
+    counts.pop(None, None)
+    counts.pop("", None)
+    return {value for value, count in counts.items() if count > 1}
+
+
+def _set_item_text(item, column, text):
+    """
+    Nastaví text buňky položky stromu, jen pokud se liší od současného.
+    Zápis stejné hodnoty by zbytečně vyvolal signál změny a překreslení.
+    
+    Args:
+        item: Položka v QTreeWidget
+        column (int): Index sloupce
+        text (str): Nový text
+    """
+    if item.text(column) != text:
+        item.setText(column, text)
+
+
+def _contiguous_ranges(rows):
+    """
+    Rozdělí čísla řádků na souvislé úseky.
+    
+    Args:
+        rows (iterable): Čísla řádků
+        
+    Returns:
+        list: Seznam dvojic (první řádek, poslední řádek) seřazený vzestupně
+    """
+    ranges = []
+    for row in sorted(rows):
+        if ranges and row == ranges[-1][1] + 1:
+            ranges[-1][1] = row
+        else:
+            ranges.append([row, row])
+    return [(first, last) for first, last in ranges]
+
+
+def _set_item_background(item, column, brush):
+    """
+    Nastaví pozadí buňky položky stromu, jen pokud se liší od současného.
+    
+    Args:
+        item: Položka v QTreeWidget
+        column (int): Index sloupce
+        brush (QBrush): Nový štětec pozadí (NO_BRUSH pro zrušení zvýraznění)
+    """
+    if item.background(column) != brush:
+        item.setBackground(column, brush)
+
+
+def _fill_project_row(item, project, highlights):
+    """
+    Nastaví texty, data a zvýraznění shodných hodnot řádku projektu ve skupině
+    všech projektů. Zapisují se jen změněné buňky, takže stejně poslouží pro
+    novou položku i pro aktualizaci zobrazené.
+    
+    Args:
+        item: Položka v QTreeWidget
+        project: Objekt projektu
+        highlights (list): Kritéria zvýraznění z ProjectListView._duplicate_highlights
+    """
+    basename = os.path.basename(project.path)
+    _set_item_text(item, 0, basename if basename else project.name)
+    _set_item_text(item, 1, project.path)
+    _set_item_text(item, SIZE_COLUMN, project.get_formatted_size())
+    _set_item_text(item, 3, project.get_formatted_last_modified())
+    
+    # Datum poslední úpravy souboru jen pokud je už známé - jeho zjištění
+    # by vyžadovalo projít všechny soubory projektu
+    _set_item_text(item, LAST_FILE_MOD_COLUMN,
+                   project.get_formatted_last_file_modified() if project.last_file_modified is not None else "-")
+    
+    # Uložíme projekt do dat položky
+    if item.data(0, Qt.UserRole) is not project:
+        item.setData(0, Qt.UserRole, project)
+    
+    # Zvýraznění shodných hodnot nastavíme i zrušíme podle aktuálních dat
+    for column, get_value, duplicates, brush in highlights:
+        _set_item_background(item, column, brush if get_value(project) in duplicates else NO_BRUSH)
+
+
+class ValueBuckets:
+    """
+    Rozdělení položek jedné skupiny stromu podle hodnoty jednoho atributu projektu.
+    Sleduje, které hodnoty sdílí více projektů, a při změně hodnoty určí, které
+    buňky je třeba přebarvit (jen u položek dotčených hodnot).
+    """
+    
+    def __init__(self, attribute, column, brush):
+        """
+        Inicializace rozdělení.
+        
+        Args:
+            attribute (str): Název atributu projektu
+            column (int): Index sloupce, jehož pozadí se obarvuje
+            brush (QBrush): Štětec pro zvýraznění shodných hodnot
+        """
+        self.attribute = attribute
+        self.column = column
+        self.brush = brush
+        self.items_by_value = defaultdict(set)  # hodnota -> položky s touto hodnotou
+        self.value_by_item = {}  # položka -> hodnota, podle které je zařazena
+    
+    def update(self, item, project, writes):
+        """
+        Zařadí položku podle aktuální hodnoty atributu projektu a zaznamená
+        potřebné změny obarvení. Pokud se hodnota od posledního zařazení
+        nezměnila, nic nedělá.
+        
+        Args:
+            item: Položka v QTreeWidget
+            project: Objekt projektu
+            writes (list): Seznam, do kterého se přidají změny pozadí buněk
+                           jako trojice (položka, sloupec, štětec); NO_BRUSH
+                           znamená zrušení zvýraznění shodné hodnoty
+        """
+        value = getattr(project, self.attribute)
+        old_value = self.value_by_item.get(item)
+        if old_value == value and item in self.value_by_item:
+            return
+        self.value_by_item[item] = value
+        column = self.column
+        
+        # Vyřazení z původní hodnoty
+        if old_value is not None:
+            old_items = self.items_by_value[old_value]
+            old_items.discard(item)
+            remaining = len(old_items)
+            if remaining == 0:
+                del self.items_by_value[old_value]
+            else:
+                writes.append((item, column, NO_BRUSH))
+                if remaining == 1:
+                    # Původní hodnotu už nesdílí žádný jiný projekt
+                    writes.append((next(iter(old_items)), column, NO_BRUSH))
+        
+        if value is None:
+            # Neznámá hodnota se nezvýrazňuje (zruší se i obarvení z naplnění stromu)
+            writes.append((item, column, NO_BRUSH))
+            return
+        
+        # Zařazení k nové hodnotě; obarví se, jakmile ji sdílí dva projekty
+        new_items = self.items_by_value[value]
+        new_items.add(item)
+        count = len(new_items)
+        if count == 1:
+            # Hodnotu zatím nemá žádný jiný projekt - případné obarvení
+            # z naplnění stromu podle dřívějších hodnot se zruší
+            writes.append((item, column, NO_BRUSH))
+            return
+        if count == 2:
+            for other in new_items:
+                writes.append((other, column, self.brush))
+        else:
+            writes.append((item, column, self.brush))
+
+
+class ProjectTreeItem(QTreeWidgetItem):
+    """
+    Položka stromu skupin nesoucí projekt.
+    Číselné sloupce (velikost, data, podobnost, počet souborů) řadí podle
+    hodnot projektu, ne podle zobrazeného textu.
+    """
+    
+    def __lt__(self, other):
+        """Porovnání položek pro řazení podle aktuálního sloupce řazení stromu."""
+        tree = self.treeWidget()
+        column = tree.sortColumn() if tree else 0
+        
+        value = self._sort_value(column)
+        other_value = other._sort_value(column) if isinstance(other, ProjectTreeItem) else None
+        if value is None or other_value is None:
+            # QTreeWidgetItem.__lt__ se v PySide6 volá zpět přes tuto metodu
+            # a zacyklí se, proto textové sloupce porovnáváme přímo
+            return self.text(column) < other.text(column)
+        return value < other_value
+    
+    def _sort_value(self, column):
+        """
+        Vrací hodnotu pro řazení podle sloupce.
+        
+        Args:
+            column (int): Index sloupce
+            
+        Returns:
+            Číselná hodnota nebo None, pokud se má řadit podle textu
+        """
+        project = self.data(0, Qt.UserRole)
+        if project is None:
+            return None
+        
+        if column == SIZE_COLUMN:  # Velikost - skutečná, pokud je známá
+            return project.real_size if project.real_size is not None else project.size
+        if column == 3:  # Datum
+            return project.last_modified
+        if column == 4:  # Podobnost v procentech
+            text = self.text(4).rstrip("%")
+            return int(text) if text.isdigit() else -1
+        if column == FILE_COUNT_COLUMN:  # Počet souborů
+            return project.real_file_count if project.real_file_count is not None else -1
+        if column == LAST_FILE_MOD_COLUMN:  # Poslední změna souboru
+            return project.last_file_modified or 0
+        return None
 
 
 class ProjectTableModel(QAbstractTableModel):
@@ -27,6 +299,15 @@ class ProjectTableModel(QAbstractTableModel):
         self.column_names = PROJECT_COLUMNS
         self.duplicates = set()  # Množina indexů duplicitních projektů
         self.similarities = {}   # Slovník podobností mezi projekty
+        
+        # Tabulka obsluhy dat podle role a sloupce - nahrazuje větvení v data()
+        tooltip_handlers = [self._tooltip_path] + [self._tooltip_default] * (len(self.column_names) - 1)
+        self._role_handlers = {
+            Qt.DisplayRole: [self._display_path, self._display_file_count,
+                             self._display_size, self._display_last_modified],
+            Qt.ToolTipRole: tooltip_handlers,
+            Qt.BackgroundRole: [self._background] * len(self.column_names),
+        }
     
     def rowCount(self, parent=QModelIndex()):
         """Vrací počet řádků v modelu."""
@@ -41,46 +322,55 @@ class ProjectTableModel(QAbstractTableModel):
         if not index.isValid() or index.row() >= len(self.projects):
             return None
         
-        project = self.projects[index.row()]
-        column = index.column()
-        
-        if role == Qt.DisplayRole:
-            if column == 0:
-                # Přidáme informaci o podobnosti k názvu projektu, pokud je k dispozici
-                if project in self.similarities:
-                    similarity = self.similarities[project]
-                    similarity_percent = int(similarity * 100)
-                    return f"{project.path} ({similarity_percent}%)"
-                return project.path
-            elif column == 1:
-                return str(project.file_count)
-            elif column == 2:
-                return project.get_formatted_size()
-            elif column == 3:
-                return project.get_formatted_last_modified()
-        
-        elif role == Qt.ToolTipRole:
-            if column == 0:
-                # Přidáme informaci o projektových souborech do tooltipu
-                tooltip = project.path
-                if project.project_files:
-                    tooltip += "\nProjektové soubory: " + ", ".join(
-                        os.path.basename(f) for f in project.project_files
-                    )
-                # Přidáme informaci o podobnosti
-                if project in self.similarities:
-                    similarity = self.similarities[project]
-                    similarity_percent = int(similarity * 100)
-                    tooltip += f"\nPodobnost: {similarity_percent}%"
-                return tooltip
-            else:
-                return project.path
-        
-        elif role == Qt.BackgroundRole:
-            # Zvýraznění duplicitních projektů
-            if index.row() in self.duplicates:
-                return QColor(DUPLICATE_COLOR)  # Použití barvy z konfigurace
+        handlers = self._role_handlers.get(role)
+        if handlers is None:
+            return None
         
+        row = index.row()
+        return handlers[index.column()](self.projects[row], row)
+    
+    def _display_path(self, project, row):
+        """Zobrazovaná cesta projektu s případnou informací o podobnosti."""
+        # Přidáme informaci o podobnosti k názvu projektu, pokud je k dispozici
+        if project in self.similarities:
+            similarity_percent = int(self.similarities[project] * 100)
+            return f"{project.path} ({similarity_percent}%)"
+        return project.path
+    
+    def _display_file_count(self, project, row):
+        """Zobrazovaný počet souborů projektu."""
+        return str(project.file_count)
+    
+    def _display_size(self, project, row):
+        """Zobrazovaná velikost projektu."""
+        return project.get_formatted_size()
+    
+    def _display_last_modified(self, project, row):
+        """Zobrazované datum poslední změny projektu."""
+        return project.get_formatted_last_modified()
+    
+    def _tooltip_path(self, project, row):
+        """Tooltip pro sloupec s cestou projektu."""
+        tooltip = project.path
+        # Přidáme informaci o projektových souborech do tooltipu
+        if project.project_files:
+            tooltip += "\nProjektové soubory: " + ", ".join(
+                os.path.basename(f) for f in project.project_files
+            )
+        # Přidáme informaci o podobnosti
+        if project in self.similarities:
+            similarity_percent = int(self.similarities[project] * 100)
+            tooltip += f"\nPodobnost: {similarity_percent}%"
+        return tooltip
+    
+    def _tooltip_default(self, project, row):
+        """Tooltip pro ostatní sloupce."""
+        return project.path
+    
+    def _background(self, project, row):
+        """Barva pozadí - zvýraznění duplicitních projektů."""
+        if row in self.duplicates:
+            return DUPLICATE_QCOLOR
         return None
     
     def headerData(self, section, orientation, role=Qt.DisplayRole):
@@ -116,12 +406,21 @@ class ProjectTableModel(QAbstractTableModel):
         Args:
             duplicates_indices (set): Množina indexů duplicitních projektů
         """
-        self.duplicates = duplicates_indices
-        # Obnovení zobrazení, aby se aplikovalo zvýraznění
-        self.dataChanged.emit(
-            self.index(0, 0),
-            self.index(self.rowCount() - 1, self.columnCount() - 1)
-        )
+        # Pozadí se mění jen u řádků, které mezi duplicity přibyly nebo z nich ubyly
+        # Ukládá se vlastní množina - seznam by zpomalil test příslušnosti v data()
+        # a další volání by nemohlo použít symetrický rozdíl
+        duplicates = set(duplicates_indices)
+        changed_rows = self.duplicates ^ duplicates
+        self.duplicates = duplicates
+        
+        # Obnovení zobrazení jedním signálem pro každý souvislý úsek změněných řádků
+        last_column = self.columnCount() - 1
+        for first, last in _contiguous_ranges(changed_rows):
+            self.dataChanged.emit(
+                self.index(first, 0),
+                self.index(last, last_column),
+                [Qt.BackgroundRole]
+            )
     
     def get_project(self, row):
         """
@@ -140,10 +439,13 @@ class ProjectTableModel(QAbstractTableModel):
     def set_similarities(self, similarities):
         """Nastaví nový slovník podobností."""
         self.similarities = similarities
-        # Obnovení zobrazení, aby se aplikovalo zvýraznění
+        if not self.projects:
+            return
+        # Obnovení zobrazení - podobnost se promítá jen do textu a tooltipu cesty
         self.dataChanged.emit(
             self.index(0, 0),
-            self.index(self.rowCount() - 1, self.columnCount() - 1)
+            self.index(self.rowCount() - 1, 0),
+            [Qt.DisplayRole, Qt.ToolTipRole]
         )
 
 
@@ -154,6 +456,42 @@ class ProjectListView(QWidget):
         """Inicializace widgetu."""
         super().__init__(parent)
         
+        # Text stavového štítku čekající na odložené nastavení
+        self._pending_status = None
+        
+        # Generátor probíhajícího postupného plnění stromu
+        self._population = None
+        
+        # Běžící úlohy výpočtu údajů projektů v QThreadPool
+        self._scan_tasks = set()
+        
+        # Projekty skupiny všech projektů, která se naplní až při rozbalení
+        self._lazy_all_projects = None
+        
+        # Rozdělení položek skupin podle shodných hodnot (skupina -> ValueBuckets)
+        self._value_buckets = {}
+        
+        # Přebarvení po výpočtech čekající na sloučení (dvojice položka, projekt)
+        self._pending_recolor = []
+        self._recolor_timer = QTimer(self)
+        self._recolor_timer.setSingleShot(True)
+        self._recolor_timer.setInterval(RECOLOR_DELAY_MS)
+        self._recolor_timer.timeout.connect(self._apply_pending_recolor)
+        
+        # Zobrazená skupina všech nalezených projektů a její položky podle cesty
+        self._all_projects_group = None
+        self._item_by_path = {}
+        
+        # Projekty, které postupné plnění skupiny ještě nevložilo,
+        # a kritéria zvýraznění shodných hodnot pro její řádky
+        self._pending_all_projects = []
+        self._all_projects_highlights = []
+        
+        # Barevné téma a z něj připravené štětce (načítají se jen při změně tématu)
+        self._theme = None
+        self._theme_brushes = {}
+        self._load_theme()
+        
         self.init_ui()
         self.duplicate_groups = []  # Seznam skupin duplicitních projektů
     
@@ -173,6 +511,8 @@ class ProjectListView(QWidget):
         # Vytvoření tabulky pro skupiny podobných projektů
         self.groups_tree = QTreeWidget()
         self.groups_tree.setHeaderLabels(GROUP_COLUMNS)  # Použití sloupců z konfigurace
+        # Všechny řádky mají stejnou výšku - pohled ji nemusí zjišťovat pro každou položku
+        self.groups_tree.setUniformRowHeights(True)
         
         # Nastavení šířky sloupců
         self._update_column_widths()
@@ -184,38 +524,22 @@ class ProjectListView(QWidget):
         
         # Změna: Používáme dvojklik místo jednoho kliknutí pro otevření složky
         self.groups_tree.itemDoubleClicked.connect(self.on_group_doubleClicked)
+        # Skupina všech projektů se naplní až při prvním rozbalení
+        self.groups_tree.itemExpanded.connect(self._on_group_item_expanded)
         # Přidání kontextového menu pro stromový pohled
         self.groups_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.groups_tree.customContextMenuRequested.connect(self.show_groups_context_menu)
         
-        # Nastavení vzhledu skupin - nyní získáme aktuální barevné schéma z ThemeManager
-        theme = ThemeManager.get_theme(ThemeManager.load_current_theme())
+        # Nastavení vzhledu skupin podle aktuálního barevného schématu
         self.groups_tree.setAlternatingRowColors(True)
-        self.groups_tree.setStyleSheet(f"""
-            QTreeWidget::item:has-children {{
-                font-weight: bold;
-                background-color: {theme["tree_header_background"]};
-            }}
-            
-            /* Zajištění čitelnosti textu při výběru položky */
-            QTreeWidget::item:selected {{
-                color: {theme["selected_item_text"]};
-                background-color: {theme["selected_item_background"]};
-            }}
-            
-            /* Zajištění čitelnosti textu při výběru položky skupiny */
-            QTreeWidget::item:has-children:selected {{
-                color: {theme["selected_item_text"]};
-                background-color: {theme["selected_item_background"]};
-                font-weight: bold;
-            }}
-        """)
+        self._apply_groups_tree_style()
         
         main_layout.addWidget(self.groups_tree)
         
         # Přidání legendy pro barevné označení
         self.color_legend = self.create_color_legend()
         main_layout.addWidget(self.color_legend)
+        self._legend_layout = main_layout  # Pro výměnu legendy při změně tématu
         
         # Informační štítek na spodní straně
         self.status_label = QLabel("Žádné projekty")
@@ -232,6 +556,48 @@ class ProjectListView(QWidget):
         widget.setLayout(main_layout)
         layout.addWidget(widget)
     
+    def _load_theme(self):
+        """Načte aktuální barevné téma a připraví z něj štětce pro položky stromu."""
+        self._theme = ThemeManager.get_theme(ThemeManager.load_current_theme())
+        self._theme_brushes = {key: QBrush(QColor(self._theme[key])) for key in THEME_COLOR_KEYS}
+    
+    def reload_theme(self):
+        """
+        Znovu načte barevné téma po jeho změně a aplikuje ho na strom skupin
+        a legendu. Barvy již zobrazených položek se obnoví při dalším naplnění stromu.
+        """
+        self._load_theme()
+        self._apply_groups_tree_style()
+        
+        # Legendu vytvoříme znovu s novými barvami
+        old_legend = self.color_legend
+        self.color_legend = self.create_color_legend()
+        self._legend_layout.replaceWidget(old_legend, self.color_legend)
+        old_legend.deleteLater()
+    
+    def _apply_groups_tree_style(self):
+        """Nastaví styl stromu skupin podle aktuálního tématu."""
+        theme = self._theme
+        self.groups_tree.setStyleSheet(f"""
+            QTreeWidget::item:has-children {{
+                font-weight: bold;
+                background-color: {theme["tree_header_background"]};
+            }}
+            
+            /* Zajištění čitelnosti textu při výběru položky */
+            QTreeWidget::item:selected {{
+                color: {theme["selected_item_text"]};
+                background-color: {theme["selected_item_background"]};
+            }}
+            
+            /* Zajištění čitelnosti textu při výběru položky skupiny */
+            QTreeWidget::item:has-children:selected {{
+                color: {theme["selected_item_text"]};
+                background-color: {theme["selected_item_background"]};
+                font-weight: bold;
+            }}
+        """)
+    
     def set_projects(self, projects):
         """
         Nastaví nový seznam projektů.
@@ -261,9 +627,28 @@ class ProjectListView(QWidget):
         """Aktualizuje informační štítek."""
         count = self.project_model.rowCount()
         if count == 0:
-            self.status_label.setText("Žádné projekty")
+            self._set_status_deferred("Žádné projekty")
         else:
-            self.status_label.setText(f"Nalezeno {count} projektů")
+            self._set_status_deferred(f"Nalezeno {count} projektů")
+    
+    def _set_status_deferred(self, message):
+        """
+        Nastaví text stavového štítku až po návratu do smyčky událostí.
+        Více změn během jednoho hromadného plnění se tak sloučí do jediného překreslení.
+        
+        Args:
+            message (str): Zpráva k zobrazení
+        """
+        already_scheduled = self._pending_status is not None
+        self._pending_status = message
+        if not already_scheduled:
+            QTimer.singleShot(0, self._apply_pending_status)
+    
+    def _apply_pending_status(self):
+        """Zobrazí poslední odloženou zprávu ve stavovém štítku."""
+        message, self._pending_status = self._pending_status, None
+        if message is not None:
+            self.status_label.setText(message)
     
     def set_filter(self, text):
         """
@@ -292,147 +677,129 @@ class ProjectListView(QWidget):
         Args:
             groups (list): Seznam skupin duplicitních projektů
         """
-        # Získání aktuálního tématu z ThemeManager
-        theme = ThemeManager.get_theme(ThemeManager.load_current_theme())
-        
         self.duplicate_groups = groups
         
-        # Vyčistíme strom skupin
-        self.groups_tree.clear()
-        
-        # Definice sloupců pro jednotlivé hodnoty
-        similarity_column = 4  # Sloupec pro podobnost
-        hash_column = 6      # Sloupec pro hash
-        size_column = 2      # Sloupec pro velikost
-        file_count_column = 5  # Sloupec pro počet souborů
-        last_file_mod_column = 7  # Sloupec pro poslední změnu souboru
-        
-        # Naplnění stromu skupinami
-        for i, group_data in enumerate(groups):
-            group = group_data['projects']
-            similarities = group_data['similarities']
-            
-            # Vytvoříme položku skupiny s informacemi o počtu projektů
-            group_item = QTreeWidgetItem(self.groups_tree)
-            group_item.setText(0, f"Skupina {i+1}")
-            group_item.setData(0, Qt.UserRole, i)  # Uložíme index skupiny
-            
-            # Zjistíme, zda máme projekty s hashem v této skupině
-            projects_with_hash = [p for p in group if hasattr(p, 'folder_hash') and p.folder_hash]
-            hash_groups = {}
-            
-            # Vytvoříme slovník projektů podle hashů
-            for project in projects_with_hash:
-                if project.folder_hash in hash_groups:
-                    hash_groups[project.folder_hash].append(project)
-                else:
-                    hash_groups[project.folder_hash] = [project]
-            
-            # Vytvoříme skupiny projektů podle jejich skutečných velikostí
-            size_groups = {}
-            for project in group:
-                if hasattr(project, 'real_size') and project.real_size is not None:
-                    if project.real_size in size_groups:
-                        size_groups[project.real_size].append(project)
-                    else:
-                        size_groups[project.real_size] = [project]
-            
-            # Vytvoříme skupiny projektů podle jejich skutečného počtu souborů
-            file_count_groups = {}
-            for project in group:
-                if hasattr(project, 'real_file_count') and project.real_file_count is not None:
-                    if project.real_file_count in file_count_groups:
-                        file_count_groups[project.real_file_count].append(project)
-                    else:
-                        file_count_groups[project.real_file_count] = [project]
-            
-            # Vytvoříme skupiny projektů podle data poslední změny souboru
-            last_mod_groups = {}
-            for project in group:
-                if hasattr(project, 'last_file_modified') and project.last_file_modified is not None:
-                    if project.last_file_modified in last_mod_groups:
-                        last_mod_groups[project.last_file_modified].append(project)
-                    else:
-                        last_mod_groups[project.last_file_modified] = [project]
-            
-            # Pro všechny projekty ve skupině
-            for project in group:
-                project_item = QTreeWidgetItem(group_item)
-                
-                # Nastavíme data pro každý sloupec
-                # Sloupec 0: Jméno projektu
-                basename = os.path.basename(project.path)
-                project_item.setText(0, basename if basename else project.name)
-                
-                # Sloupec 1: Cesta projektu
-                project_item.setText(1, project.path)
-                
-                # Sloupec 2: Velikost projektu
-                project_item.setText(2, project.get_formatted_size())
+        # Strom se během plnění nepřekresluje, neřadí ani nevysílá signály
+        with self._frozen_tree() as tree:
+            # Vyčistíme strom skupin
+            self._clear_groups_tree()
+            
+            # Barvy z tématu vytvoříme jednou pro celé naplnění stromu
+            same_hash_brush = self._theme_brushes["same_hash_color"]
+            same_size_brush = self._theme_brushes["same_size_color"]
+            same_files_brush = self._theme_brushes["same_files_color"]
+            same_date_brush = self._theme_brushes["same_date_color"]
+            column_count = self.groups_tree.columnCount()
+            
+            # Metody položek svážeme do lokálních proměnných - ve smyčce přes
+            # všechny projekty se tak neopakuje vyhledávání atributů
+            set_text = QTreeWidgetItem.setText
+            set_background = QTreeWidgetItem.setBackground
+            
+            # Naplnění stromu skupinami - položky vytváříme bez rodiče
+            # a do stromu je vložíme najednou
+            group_items = []
+            for i, group_data in enumerate(groups):
+                group = group_data['projects']
+                max_similarities = group_data.get('max_similarities', {})
+
+                # Vytvoříme položku skupiny s informacemi o počtu projektů
+                group_item = QTreeWidgetItem()
+                group_item.setText(0, f"Skupina {i+1}")
+                group_item.setData(0, Qt.UserRole, i)  # Uložíme index skupiny
                 
-                # Sloupec 3: Datum poslední změny
-                project_item.setText(3, project.get_formatted_last_modified())
+                # Hodnoty atributů načteme jen jednou a uložíme i pro obarvení níže
+                project_values = [
+                    (project,
+                     project.folder_hash or None,
+                     project.real_size,
+                     project.real_file_count,
+                     project.last_file_modified)
+                    for project in group
+                ]
                 
-                # Sloupec 4: Podobnost v procentech
-                # Najdeme nejvyšší podobnost pro tento projekt
-                max_similarity = 0
-                for other_project in group:
-                    if project != other_project and (project, other_project) in similarities:
-                        max_similarity = max(max_similarity, similarities[(project, other_project)])
+                # Množiny hashů, skutečných velikostí, skutečných počtů souborů
+                # a dat poslední změny souboru sdílených alespoň dvěma projekty
+                hash_duplicates = _duplicate_values(map(itemgetter(1), project_values))
+                size_duplicates = _duplicate_values(map(itemgetter(2), project_values))
+                file_count_duplicates = _duplicate_values(map(itemgetter(3), project_values))
+                last_mod_duplicates = _duplicate_values(map(itemgetter(4), project_values))
                 
-                # Zobrazíme podobnost jako procenta
-                if max_similarity > 0:
-                    similarity_percent = int(max_similarity * 100)
-                    project_item.setText(4, f"{similarity_percent}%")
+                # Pro všechny projekty ve skupině
+                project_items = []
+                for project, folder_hash, real_size, real_file_count, last_file_modified in project_values:
+                    project_item = ProjectTreeItem()
+                    project_items.append(project_item)
                     
-                    # Obarvení celého řádku podle podobnosti
-                    if max_similarity >= 0.99:  # 99% a více považujeme za "100%"
-                        # Obarvíme celý řádek světle zeleně pro vysokou podobnost
-                        for col in range(self.groups_tree.columnCount()):
-                            project_item.setBackground(col, QColor("#AAFFAA"))  # Světle zelená
-                
-                # Uložíme projekt do dat položky
-                project_item.setData(0, Qt.UserRole, project)
-                
-                # Obarvíme buňku s hashem pro projekty se shodným hashem
-                if hasattr(project, 'folder_hash') and project.folder_hash:
-                    # Pokud existují alespoň dva projekty se stejným hashem
-                    if project.folder_hash in hash_groups and len(hash_groups[project.folder_hash]) > 1:
-                        project_item.setBackground(hash_column, QColor(theme["same_hash_color"]))
-                
-                # Obarvíme buňku s velikostí pro projekty se stejnou skutečnou velikostí
-                if hasattr(project, 'real_size') and project.real_size is not None:
-                    if project.real_size in size_groups and len(size_groups[project.real_size]) > 1:
-                        project_item.setBackground(size_column, QColor(theme["same_size_color"]))
-                
-                # Obarvíme buňku s počtem souborů pro projekty se stejným počtem souborů
-                if hasattr(project, 'real_file_count') and project.real_file_count is not None:
-                    if project.real_file_count in file_count_groups and len(file_count_groups[project.real_file_count]) > 1:
-                        project_item.setBackground(file_count_column, QColor(theme["same_files_color"]))
-                
-                # Obarvíme buňku s datem poslední změny souboru pro projekty se stejným datem
-                if hasattr(project, 'last_file_modified') and project.last_file_modified is not None:
-                    if project.last_file_modified in last_mod_groups and len(last_mod_groups[project.last_file_modified]) > 1:
-                        project_item.setBackground(last_file_mod_column, QColor(theme["same_date_color"]))
-                
-                # Přidáme datum poslední úpravy souboru
-                try:
-                    project_item.setText(last_file_mod_column, project.get_formatted_last_file_modified())
-                except Exception as e:
-                    project_item.setText(last_file_mod_column, "-")
-        
-        # Zobrazíme sekci skupin, pokud existují skupiny
-        if groups:
-            # Rozbalíme všechny skupiny pro lepší přehlednost
-            for i in range(self.groups_tree.topLevelItemCount()):
-                group_item = self.groups_tree.topLevelItem(i)
-                self.groups_tree.expandItem(group_item)
+                    # Nastavíme data pro každý sloupec
+                    # Sloupec 0: Jméno projektu
+                    basename = os.path.basename(project.path)
+                    set_text(project_item, 0, basename if basename else project.name)
+                    
+                    # Sloupec 1: Cesta projektu
+                    set_text(project_item, 1, project.path)
+                    
+                    # Sloupec 2: Velikost projektu
+                    set_text(project_item, SIZE_COLUMN, project.get_formatted_size())
+                    
+                    # Sloupec 3: Datum poslední změny
+                    set_text(project_item, 3, project.get_formatted_last_modified())
+                    
+                    # Sloupec 4: Podobnost v procentech
+                    # Nejvyšší podobnost pro tento projekt je předpočítaná modelem
+                    max_similarity = max_similarities.get(project, 0)
+
+                    # Zobrazíme podobnost jako procenta
+                    if max_similarity > 0:
+                        similarity_percent = int(max_similarity * 100)
+                        set_text(project_item, 4, f"{similarity_percent}%")
+                        
+                        # Obarvení celého řádku podle podobnosti
+                        if max_similarity >= 0.99:  # 99% a více považujeme za "100%"
+                            # Obarvíme celý řádek světle zeleně pro vysokou podobnost
+                            for col in range(column_count):
+                                set_background(project_item, col, HIGH_SIMILARITY_BRUSH)
+                    
+                    # Uložíme projekt do dat položky
+                    project_item.setData(0, Qt.UserRole, project)
+                    
+                    # Obarvíme buňku s hashem pro projekty se shodným hashem
+                    if folder_hash in hash_duplicates:
+                        set_background(project_item, HASH_COLUMN, same_hash_brush)
+                    
+                    # Obarvíme buňku s velikostí pro projekty se stejnou skutečnou velikostí
+                    if real_size in size_duplicates:
+                        set_background(project_item, SIZE_COLUMN, same_size_brush)
+                    
+                    # Obarvíme buňku s počtem souborů pro projekty se stejným počtem souborů
+                    if real_file_count in file_count_duplicates:
+                        set_background(project_item, FILE_COUNT_COLUMN, same_files_brush)
+                    
+                    # Obarvíme buňku s datem poslední změny souboru pro projekty se stejným datem
+                    if last_file_modified in last_mod_duplicates:
+                        set_background(project_item, LAST_FILE_MOD_COLUMN, same_date_brush)
+                    
+                    # Přidáme datum poslední úpravy souboru (jen pokud je už známé -
+                    # jeho zjištění by vyžadovalo projít všechny soubory projektu)
+                    set_text(project_item, LAST_FILE_MOD_COLUMN,
+                             project.get_formatted_last_file_modified() if last_file_modified is not None else "-")
                 
-            # Aktualizujeme informaci o počtu skupin
-            self.status_label.setText(f"Nalezeno {len(groups)} skupin podobných projektů")
-        else:
-            self.groups_tree.clear()
-            self.status_label.setText("Žádné skupiny podobných projektů")
+                group_item.addChildren(project_items)
+                group_items.append(group_item)
+            
+            tree.addTopLevelItems(group_items)
+            
+            # Zobrazíme sekci skupin, pokud existují skupiny
+            if groups:
+                # Rozbalíme všechny skupiny pro lepší přehlednost
+                for group_item in group_items:
+                    tree.expandItem(group_item)
+                    
+                # Aktualizujeme informaci o počtu skupin
+                self._set_status_deferred(f"Nalezeno {len(groups)} skupin podobných projektů")
+            else:
+                self._clear_groups_tree()
+                self._set_status_deferred("Žádné skupiny podobných projektů")
     
     def on_group_doubleClicked(self, item, column=0):
         """
@@ -447,8 +814,7 @@ class ProjectListView(QWidget):
             data = item.data(0, Qt.UserRole)
             if data and hasattr(data, 'path'):
                 # Otevření složky s projektem
-                from controller.app_controller import AppController
-                AppController.open_directory(data.path)
+                _get_app_controller().open_directory(data.path)
                 
                 # Zobrazení detailů ve stavovém řádku
                 self.status_label.setText(f"Otevřen projekt: {data.name} ({data.path})")
@@ -488,21 +854,25 @@ class ProjectListView(QWidget):
         show_details_action = QAction("Zobrazit detaily", self)
         context_menu.addAction(show_details_action)
         
+        # Obsluha akcí - slovník {akce: funkce}
+        handlers = {
+            open_folder_action: self.open_folder,
+            show_details_action: lambda: self.show_project_details(selected_project),
+        }
+        
         # Zobrazení menu
         action = context_menu.exec(self.table_view.mapToGlobal(position))
         
         # Zpracování vybrané akce
-        if action == open_folder_action:
-            self.open_folder()
-        elif action == show_details_action:
-            self.show_project_details(selected_project)
+        handler = handlers.get(action)
+        if handler:
+            handler()
     
     def open_folder(self):
         """Otevře složku vybraného projektu v souborovém manažeru."""
         project = self.get_selected_project()
         if project:
-            from controller.app_controller import AppController
-            AppController.open_directory(project.path)
+            _get_app_controller().open_directory(project.path)
     
     def show_project_details(self, project):
         """
@@ -517,109 +887,194 @@ class ProjectListView(QWidget):
     def show_all_projects(self, projects):
         """
         Zobrazí všechny nalezené projekty ve stromovém pohledu.
+        Položky se vkládají po dávkách mezi nimiž se vrací řízení smyčce
+        událostí, takže GUI zůstává během plnění velkých seznamů responzivní.
+        Pokud už strom skupinu všech projektů zobrazuje, aktualizuje se na místě.
         
         Args:
             projects (list): Seznam všech projektů
         """
         if not projects:
             return
+        
+        # Zobrazenou skupinu jen aktualizujeme, strom se znovu nevytváří
+        if self._all_projects_group is not None:
+            self._refresh_all_projects_group(projects)
+            return
             
         # Vyčistíme strom skupin
-        self.groups_tree.clear()
-        
-        # Definice sloupců pro jednotlivé hodnoty
-        hash_column = 6      # Sloupec pro hash
-        size_column = 2      # Sloupec pro velikost
-        file_count_column = 5  # Sloupec pro počet souborů
-        last_file_mod_column = 7  # Sloupec pro poslední změnu souboru
+        self._clear_groups_tree()
         
         # Vytvoříme skupinu pro všechny projekty
         all_projects_group = QTreeWidgetItem(self.groups_tree)
         all_projects_group.setText(0, "Všechny nalezené projekty")
         all_projects_group.setData(0, Qt.UserRole, -1)  # Speciální hodnota pro skupinu všech projektů
+        self._all_projects_group = all_projects_group
         
-        # Vytvoříme slovník projektů podle hashů
-        hash_groups = {}
-        for project in projects:
-            if hasattr(project, 'folder_hash') and project.folder_hash:
-                if project.folder_hash in hash_groups:
-                    hash_groups[project.folder_hash].append(project)
-                else:
-                    hash_groups[project.folder_hash] = [project]
-        
-        # Vytvoříme skupiny projektů podle jejich skutečných velikostí
-        size_groups = {}
-        for project in projects:
-            if hasattr(project, 'real_size') and project.real_size is not None:
-                if project.real_size in size_groups:
-                    size_groups[project.real_size].append(project)
-                else:
-                    size_groups[project.real_size] = [project]
-        
-        # Vytvoříme skupiny projektů podle jejich skutečného počtu souborů
-        file_count_groups = {}
-        for project in projects:
-            if hasattr(project, 'real_file_count') and project.real_file_count is not None:
-                if project.real_file_count in file_count_groups:
-                    file_count_groups[project.real_file_count].append(project)
-                else:
-                    file_count_groups[project.real_file_count] = [project]
-        
-        # Vytvoříme skupiny projektů podle data poslední změny souboru
-        last_mod_groups = {}
-        for project in projects:
-            if hasattr(project, 'last_file_modified') and project.last_file_modified is not None:
-                if project.last_file_modified in last_mod_groups:
-                    last_mod_groups[project.last_file_modified].append(project)
-                else:
-                    last_mod_groups[project.last_file_modified] = [project]
+        # Rozbalíme skupinu
+        self.groups_tree.expandItem(all_projects_group)
         
-        # Přidáme všechny projekty do skupiny
-        for project in projects:
-            project_item = QTreeWidgetItem(all_projects_group)
-            
-            # Nastavíme data pro každý sloupec
-            basename = os.path.basename(project.path)
-            project_item.setText(0, basename if basename else project.name)
-            project_item.setText(1, project.path)
-            project_item.setText(2, project.get_formatted_size())
-            project_item.setText(3, project.get_formatted_last_modified())
-            
-            # Uložíme projekt do dat položky
-            project_item.setData(0, Qt.UserRole, project)
-            
-            # Obarvíme buňku s hashem pro projekty se shodným hashem
-            if hasattr(project, 'folder_hash') and project.folder_hash:
-                # Pokud existují alespoň dva projekty se stejným hashem
-                if project.folder_hash in hash_groups and len(hash_groups[project.folder_hash]) > 1:
-                    project_item.setBackground(hash_column, QColor(theme["same_hash_color"]))
-            
-            # Obarvíme buňku s velikostí pro projekty se stejnou skutečnou velikostí
-            if hasattr(project, 'real_size') and project.real_size is not None:
-                if project.real_size in size_groups and len(size_groups[project.real_size]) > 1:
-                    project_item.setBackground(size_column, QColor(theme["same_size_color"]))
-            
-            # Obarvíme buňku s počtem souborů pro projekty se stejným počtem souborů
-            if hasattr(project, 'real_file_count') and project.real_file_count is not None:
-                if project.real_file_count in file_count_groups and len(file_count_groups[project.real_file_count]) > 1:
-                    project_item.setBackground(file_count_column, QColor(theme["same_files_color"]))
-            
-            # Obarvíme buňku s datem poslední změny souboru pro projekty se stejným datem
-            if hasattr(project, 'last_file_modified') and project.last_file_modified is not None:
-                if project.last_file_modified in last_mod_groups and len(last_mod_groups[project.last_file_modified]) > 1:
-                    project_item.setBackground(last_file_mod_column, QColor(theme["same_date_color"]))
+        # Spustíme postupné plnění skupiny; první dávku vložíme hned
+        self._all_projects_highlights = self._duplicate_highlights(projects)
+        self._pending_all_projects = list(projects)
+        self._start_all_projects_fill()
+    
+    def _duplicate_highlights(self, projects):
+        """
+        Předem zjistí, které hodnoty se mezi projekty opakují; při plnění řádků
+        pak stačí jediný test příslušnosti k množině pro každý projekt a kritérium.
+        
+        Args:
+            projects (list): Seznam všech projektů
             
-            # Přidáme datum poslední úpravy souboru
-            try:
-                project_item.setText(last_file_mod_column, project.get_formatted_last_file_modified())
-            except Exception as e:
-                project_item.setText(last_file_mod_column, "-")
+        Returns:
+            list: Čtveřice (sloupec, funkce pro hodnotu, opakované hodnoty, štětec)
+        """
+        brushes = self._theme_brushes
+        highlights = []
+        for column, attribute, color_key in (
+            (HASH_COLUMN, 'folder_hash', "same_hash_color"),
+            (SIZE_COLUMN, 'real_size', "same_size_color"),
+            (FILE_COUNT_COLUMN, 'real_file_count', "same_files_color"),
+            (LAST_FILE_MOD_COLUMN, 'last_file_modified', "same_date_color"),
+        ):
+            get_value = attrgetter(attribute)
+            highlights.append((column, get_value, _duplicate_values(map(get_value, projects)), brushes[color_key]))
+        return highlights
+    
+    def _start_all_projects_fill(self):
+        """Spustí postupné plnění skupiny všech projektů, pokud ještě neběží."""
+        if self._population is not None:
+            return
+        self._population = self._fill_all_projects_group(self._all_projects_group, self._pending_all_projects)
+        self._populate_step(self._population)
+    
+    def _fill_all_projects_group(self, all_projects_group, pending):
+        """
+        Generátor, který plní skupinu všech projektů a po každé dávce
+        POPULATE_CHUNK_SIZE položek přeruší práci. Projekty odebírá ze seznamu
+        pending, který může _refresh_all_projects_group mezi dávkami upravit.
         
-        # Rozbalíme skupinu
-        self.groups_tree.expandItem(all_projects_group)
+        Args:
+            all_projects_group: Položka skupiny v QTreeWidget
+            pending (list): Projekty, které se mají do skupiny ještě vložit
+        """
+        item_by_path = self._item_by_path
+        
+        while pending:
+            # Položky dávky vytváříme bez rodiče a do skupiny je vložíme najednou
+            batch = pending[:POPULATE_CHUNK_SIZE]
+            del pending[:POPULATE_CHUNK_SIZE]
+            highlights = self._all_projects_highlights
+            chunk = {}  # cesta projektu -> položka
+            for project in batch:
+                project_item = ProjectTreeItem()
+                _fill_project_row(project_item, project, highlights)
+                chunk[project.path] = project_item
+            all_projects_group.addChildren(list(chunk.values()))
+            item_by_path.update(chunk)
+            
+            # Rozdělení podle hodnot nové položky neobsahuje - sestaví se znovu
+            self._value_buckets.pop(all_projects_group, None)
+            
+            # Po každé dávce vrátíme řízení smyčce událostí
+            if pending:
+                yield
         
         # Aktualizujeme informační štítek
-        self.status_label.setText(f"Nalezeno {len(projects)} projektů")
+        self._set_status_deferred(f"Nalezeno {len(item_by_path)} projektů")
+    
+    def _populate_step(self, population):
+        """
+        Zpracuje jednu dávku postupného plnění stromu a naplánuje další.
+        
+        Args:
+            population: Generátor plnění, ke kterému dávka patří
+        """
+        # Plnění mezitím mohlo být zrušeno nebo nahrazeno novým
+        if population is not self._population:
+            return
+        
+        try:
+            next(population)
+        except StopIteration:
+            self._population = None
+            return
+        
+        QTimer.singleShot(0, lambda: self._populate_step(population))
+    
+    def _refresh_all_projects_group(self, projects):
+        """
+        Aktualizuje zobrazenou skupinu všech projektů na místě. U zachovaných
+        projektů se přepíšou jen změněné buňky a odeberou se jen položky projektů,
+        které v seznamu už nejsou. Položky pro nové projekty vloží postupné
+        plnění - rozpracované pokračuje, jinak se spustí nové.
+        
+        Args:
+            projects (list): Seznam všech projektů
+        """
+        all_projects_group = self._all_projects_group
+        item_by_path = self._item_by_path
+        projects_by_path = {project.path: project for project in projects}
+        
+        # Shodné hodnoty se zjišťují z celého seznamu; platí i pro dosud nevložené řádky
+        highlights = self._all_projects_highlights = self._duplicate_highlights(projects)
+        
+        with self._frozen_tree():
+            # Odebereme položky projektů, které v seznamu už nejsou
+            for path in item_by_path.keys() - projects_by_path.keys():
+                all_projects_group.removeChild(item_by_path.pop(path))
+            
+            # Aktualizujeme jen už existující řádky
+            for path, project_item in item_by_path.items():
+                _fill_project_row(project_item, projects_by_path[path], highlights)
+        
+        # Obarvení se změnilo - rozdělení podle hodnot se při dalším výpočtu sestaví znovu
+        self._value_buckets.pop(all_projects_group, None)
+        
+        # Zbývající projekty vloží postupné plnění (seznam sdílí s generátorem)
+        self._pending_all_projects[:] = [
+            project for path, project in projects_by_path.items() if path not in item_by_path
+        ]
+        if self._pending_all_projects:
+            self._start_all_projects_fill()
+        else:
+            # Aktualizujeme informační štítek
+            self._set_status_deferred(f"Nalezeno {len(projects)} projektů")
+    
+    def _clear_groups_tree(self):
+        """Vyčistí strom skupin a zruší případné probíhající postupné plnění."""
+        self._population = None
+        self._lazy_all_projects = None
+        self._value_buckets = {}
+        self._pending_recolor = []
+        self._all_projects_group = None
+        self._item_by_path = {}
+        self._pending_all_projects = []
+        self._all_projects_highlights = []
+        self.groups_tree.clear()
+
+    @contextmanager
+    def _frozen_tree(self):
+        """
+        Kontextový manažer pro hromadné úpravy stromu skupin.
+        Po dobu úprav vypne překreslování, řazení a signály stromu
+        a po jejich skončení (i při výjimce) vše obnoví.
+        
+        Yields:
+            QTreeWidget: Strom skupin
+        """
+        tree = self.groups_tree
+        sorting_enabled = tree.isSortingEnabled()
+        tree.setUpdatesEnabled(False)
+        tree.setSortingEnabled(False)
+        signals_blocked = tree.blockSignals(True)
+        try:
+            yield tree
+        finally:
+            tree.blockSignals(signals_blocked)
+            tree.setSortingEnabled(sorting_enabled)
+            tree.setUpdatesEnabled(True)
 
     def show_groups_context_menu(self, position):
         """
@@ -663,58 +1118,28 @@ class ProjectListView(QWidget):
             # Přidání položek pro řazení
             sort_submenu = context_menu.addMenu("Seřadit projekty ve skupině podle")
             
-            sort_by_name_action = QAction("Názvu", self)
-            sort_submenu.addAction(sort_by_name_action)
-            
-            sort_by_path_action = QAction("Cesty", self)
-            sort_submenu.addAction(sort_by_path_action)
-            
-            sort_by_size_action = QAction("Velikosti", self)
-            sort_submenu.addAction(sort_by_size_action)
-            
-            sort_by_date_action = QAction("Data úpravy", self)
-            sort_submenu.addAction(sort_by_date_action)
-            
-            sort_by_similarity_action = QAction("Podobnosti", self)
-            sort_submenu.addAction(sort_by_similarity_action)
-            
-            sort_by_file_count_action = QAction("Počtu souborů", self)
-            sort_submenu.addAction(sort_by_file_count_action)
-            
-            sort_by_hash_action = QAction("Hashe", self)
-            sort_submenu.addAction(sort_by_hash_action)
-            
-            sort_by_last_file_mod_action = QAction("Data poslední změny souboru", self)
-            sort_submenu.addAction(sort_by_last_file_mod_action)
-            
-            # Zobrazení menu
-            action = context_menu.exec(self.groups_tree.mapToGlobal(position))
-            
-            # Zpracování vybrané akce
-            if action == calculate_real_size_action:
-                self.calculate_real_folder_sizes_action()
-            elif action == calculate_hash_action:
-                self.calculate_folder_hashes_action()
-            elif action == calculate_last_mod_action:
-                self.calculate_last_file_modified_action()
-            elif action == calculate_all_data_action:
-                self.calculate_all_data_action()
-            elif action == sort_by_name_action:
-                self.sort_group(item, 0)
-            elif action == sort_by_path_action:
-                self.sort_group(item, 1)
-            elif action == sort_by_size_action:
-                self.sort_group(item, 2)
-            elif action == sort_by_date_action:
-                self.sort_group(item, 3)
-            elif action == sort_by_similarity_action:
-                self.sort_group(item, 4)
-            elif action == sort_by_file_count_action:
-                self.sort_group(item, 5)
-            elif action == sort_by_hash_action:
-                self.sort_group(item, 6)
-            elif action == sort_by_last_file_mod_action:
-                self.sort_group(item, 7)
+            # Obsluha akcí - slovník {akce: funkce}
+            handlers = {
+                calculate_real_size_action: self.calculate_real_folder_sizes_action,
+                calculate_hash_action: self.calculate_folder_hashes_action,
+                calculate_last_mod_action: self.calculate_last_file_modified_action,
+                calculate_all_data_action: self.calculate_all_data_action,
+            }
+            
+            sort_columns = (
+                ("Názvu", 0),
+                ("Cesty", 1),
+                ("Velikosti", SIZE_COLUMN),
+                ("Data úpravy", 3),
+                ("Podobnosti", 4),
+                ("Počtu souborů", FILE_COUNT_COLUMN),
+                ("Hashe", HASH_COLUMN),
+                ("Data poslední změny souboru", LAST_FILE_MOD_COLUMN),
+            )
+            for label, column in sort_columns:
+                sort_action = QAction(label, self)
+                sort_submenu.addAction(sort_action)
+                handlers[sort_action] = lambda column=column: self.sort_group(item, column)
         else:
             # Akce pro kontextové menu projektu
             open_folder_action = QAction("Otevřít složku", self)
@@ -733,27 +1158,25 @@ class ProjectListView(QWidget):
             calculate_all_data_action = QAction("Vypočítat všechny údaje najednou", self)
             context_menu.addAction(calculate_all_data_action)
             
-            # Zobrazení menu
-            action = context_menu.exec(self.groups_tree.mapToGlobal(position))
-            
-            # Zpracování vybrané akce
-            if action == open_folder_action:
-                data = item.data(0, Qt.UserRole)
-                if data and hasattr(data, 'path'):
-                    from controller.app_controller import AppController
-                    AppController.open_directory(data.path)
-            elif action == calculate_hash_action:
-                data = item.data(0, Qt.UserRole)
-                if data and hasattr(data, 'path'):
-                    self.calculate_project_hash(item, data)
-            elif action == calculate_last_mod_action:
-                data = item.data(0, Qt.UserRole)
-                if data and hasattr(data, 'path'):
-                    self.calculate_project_last_modified(item, data)
-            elif action == calculate_all_data_action:
-                data = item.data(0, Qt.UserRole)
-                if data and hasattr(data, 'path'):
-                    self.calculate_all_data_for_project(item, data)
+            # Obsluha akcí - slovník {akce: funkce}
+            data = item.data(0, Qt.UserRole)
+            if data and hasattr(data, 'path'):
+                handlers = {
+                    open_folder_action: lambda: _get_app_controller().open_directory(data.path),
+                    calculate_hash_action: lambda: self.calculate_project_hash(item, data),
+                    calculate_last_mod_action: lambda: self.calculate_project_last_modified(item, data),
+                    calculate_all_data_action: lambda: self.calculate_all_data_for_project(item, data),
+                }
+            else:
+                handlers = {}
+        
+        # Zobrazení menu
+        action = context_menu.exec(self.groups_tree.mapToGlobal(position))
+        
+        # Zpracování vybrané akce
+        handler = handlers.get(action)
+        if handler:
+            handler()
     
     def sort_group(self, group_item, column):
         """
@@ -766,22 +1189,8 @@ class ProjectListView(QWidget):
         # Nastavení indikátoru řazení na hlavičce sloupce
         self.groups_tree.header().setSortIndicator(column, Qt.AscendingOrder)
         
-        # Získání všech potomků skupiny
-        children = []
-        for i in range(group_item.childCount()):
-            child = group_item.child(i)
-            children.append(child)
-        
-        # Odebrání potomků z položky
-        for child in children:
-            group_item.removeChild(child)
-        
-        # Seřazení potomků podle textu v daném sloupci
-        children.sort(key=lambda x: x.text(column))
-        
-        # Přidání seřazených potomků zpět do položky
-        for child in children:
-            group_item.addChild(child)
+        # Seřazení potomků přímo v Qt - číselné sloupce porovnává ProjectTreeItem
+        group_item.sortChildren(column, Qt.AscendingOrder)
             
         # Aktualizace informace ve stavovém řádku
         self.status_label.setText(f"Projekty seřazeny podle sloupce {self.groups_tree.headerItem().text(column)}")
@@ -789,6 +1198,8 @@ class ProjectListView(QWidget):
     def calculate_all_data(self, group_item):
         """
         Vypočítá všechny dodatečné údaje pro projekty ve skupině.
+        Každý projekt se zpracuje v samostatné úloze na pozadí, takže se
+        projekty procházejí souběžně a GUI během výpočtu nezamrzne.
         
         Args:
             group_item: Položka skupiny v QTreeWidget
@@ -804,85 +1215,129 @@ class ProjectListView(QWidget):
             if project:
                 projects.append((child_item, project))
         
-        # Nejprve vypočítáme skutečné velikosti a počty souborů
-        calculate_real_folder_sizes(group_item, projects, self.status_label, self._update_coloring_after_calculation)
-        
-        # Pak vypočítáme hash pro každý projekt
-        calculate_folder_hashes(group_item, self.status_label, self._update_coloring_after_calculation)
-        
-        # Nakonec zjistíme datum poslední změny souboru
-        calculate_last_file_modified(group_item, self.status_label)
-        
-        # Aktualizace informace ve stavovém řádku
-        self.status_label.setText(f"Všechny údaje byly vypočítány pro skupinu projektů")
+        self._start_project_scans(projects, "Všechny údaje byly vypočítány pro skupinu projektů",
+                                  notify_controller=True)
 
     def calculate_all_data_for_project(self, item, project):
         """
-        Vypočítá všechny dodatečné údaje pro jeden projekt.
+        Vypočítá všechny dodatečné údaje pro jeden projekt na pozadí.
         
         Args:
             item: Položka v QTreeWidget
             project: Objekt projektu
         """
-        from PySide6.QtWidgets import QApplication
-        
-        # Nastavení kurzoru na čekání
-        QApplication.setOverrideCursor(Qt.WaitCursor)
-        
         # Aktualizace informace ve stavovém řádku
         self.status_label.setText(f"Výpočet všech údajů pro projekt: {project.name}...")
         
+        self._start_project_scans([(item, project)],
+                                  f"Všechny údaje byly vypočítány pro projekt: {project.name}")
+
+    def _start_project_scans(self, projects, finished_message, notify_controller=False):
+        """
+        Spustí výpočet všech údajů pro projekty v QThreadPool - jedna úloha na projekt.
+        
+        Args:
+            projects (list): Seznam dvojic (item, projekt)
+            finished_message (str): Zpráva zobrazená po dokončení všech úloh
+            notify_controller (bool): Zda po dokončení informovat controller o nových datech
+        """
+        if not projects:
+            self.status_label.setText(finished_message)
+            return
+        
+        # Společný stav dávky sdílený všemi jejími úlohami
+        batch = {
+            "remaining": len(projects),
+            "projects": projects,
+            "message": finished_message,
+            "notify_controller": notify_controller,
+        }
+        
+        pool = QThreadPool.globalInstance()
+        for item, project in projects:
+            task = ProjectScanTask(item, project)
+            task.batch = batch
+            task.signals.finished.connect(self._on_project_scan_finished)
+            # Odkaz na úlohu držíme, dokud nedoběhne (jinak by ji mohl uvolnit garbage collector)
+            self._scan_tasks.add(task)
+            pool.start(task)
+
+    @Slot(object)
+    def _on_project_scan_finished(self, task):
+        """
+        Zobrazí výsledky úlohy ProjectScanTask. Běží ve vlákně GUI.
+        
+        Args:
+            task (ProjectScanTask): Dokončená úloha
+        """
+        self._scan_tasks.discard(task)
+        project = task.project
+        
         try:
-            # Nejprve vypočítáme skutečnou velikost a počet souborů
-            total_size = 0
-            file_count = 0
-            
-            # Prochází rekurzivně všechny soubory ve složce (bez filtrování)
-            for dirpath, dirnames, filenames in os.walk(project.path):
-                # Odstranění ignorovaných adresářů z procházení
-                dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS]
-                
-                # Přidáme velikosti souborů
-                for file in filenames:
-                    file_path = os.path.join(dirpath, file)
-                    try:
-                        total_size += os.path.getsize(file_path)
-                        file_count += 1
-                    except (OSError, FileNotFoundError):
-                        pass  # Ignorujeme soubory, ke kterým nemáme přístup
-            
-            # Uložení skutečných hodnot do objektu projektu
-            project.real_size = total_size
-            project.real_file_count = file_count
-            
-            # Aktualizace dat v tabulce
-            if total_size >= 1024 * 1024 * 1024:  # Více než 1 GB
-                size_str = f"{total_size / (1024 * 1024 * 1024):.2f} GB"
-            elif total_size >= 1024 * 1024:  # Více než 1 MB
-                size_str = f"{total_size / (1024 * 1024):.2f} MB"
-            else:  # V KB
-                size_str = f"{total_size / 1024:.2f} KB"
-            
-            size_column = 2      # Sloupec pro velikost
-            file_count_column = 5  # Sloupec pro počet souborů
-            
-            item.setText(size_column, size_str)  # Aktualizace sloupce s velikostí
-            item.setText(file_count_column, str(file_count))  # Nastavení počtu souborů
-            
-            # Pak vypočítáme hash
-            self.calculate_project_hash(item, project)
-            
-            # Nakonec zjistíme datum poslední změny souboru
-            self.calculate_project_last_modified(item, project)
-            
-            # Aktualizace informace ve stavovém řádku
-            self.status_label.setText(f"Všechny údaje byly vypočítány pro projekt: {project.name}")
-            
+            if task.error:
+                self.status_label.setText(f"Chyba při výpočtu údajů: {task.error}")
+            else:
+                self._show_project_data(task.item, project)
+                self.status_label.setText(f"Načtena skutečná data pro: {project.name}")
+        except RuntimeError:
+            pass  # Položka mezitím zmizela ze stromu (strom byl znovu naplněn)
         except Exception as e:
-            self.status_label.setText(f"Chyba při výpočtu údajů: {str(e)}")
+            # Chyba jednoho projektu nesmí zastavit zbytek dávky
+            self.status_label.setText(f"Chyba při zobrazení údajů projektu {project.name}: {str(e)}")
+        finally:
+            # Úloha se z dávky odečte vždy, jinak by dávka nikdy neskončila
+            self._finish_scan_batch_task(task.batch)
+    
+    def _finish_scan_batch_task(self, batch):
+        """
+        Odečte dokončenou úlohu z dávky a po poslední úloze dávku uzavře.
         
-        # Obnovení normálního kurzoru
-        QApplication.restoreOverrideCursor()
+        Args:
+            batch (dict): Společný stav dávky úloh z _start_project_scans
+        """
+        batch["remaining"] -= 1
+        if batch["remaining"] > 0:
+            return
+        
+        # Všechny úlohy dávky doběhly - obarvíme shodné hodnoty
+        self._update_coloring_after_calculation(batch["projects"])
+        self.status_label.setText(batch["message"])
+        
+        # Signál pro aktualizaci projektů v modelu
+        if batch["notify_controller"]:
+            _get_app_controller().update_projects_with_real_data()
+
+    def _show_project_data(self, item, project):
+        """
+        Zapíše vypočítané údaje projektu do položky stromu.
+        
+        Args:
+            item: Položka v QTreeWidget
+            project: Objekt projektu
+        """
+        total_size = project.real_size
+        
+        # Aktualizace dat v tabulce
+        if total_size is None:  # Velikost se nepodařilo zjistit
+            size_str = "-"
+        elif total_size >= 1024 * 1024 * 1024:  # Více než 1 GB
+            size_str = f"{total_size / (1024 * 1024 * 1024):.2f} GB"
+        elif total_size >= 1024 * 1024:  # Více než 1 MB
+            size_str = f"{total_size / (1024 * 1024):.2f} MB"
+        else:  # V KB
+            size_str = f"{total_size / 1024:.2f} KB"
+        
+        _set_item_text(item, SIZE_COLUMN, size_str)  # Aktualizace sloupce s velikostí
+        file_count = project.real_file_count
+        _set_item_text(item, FILE_COUNT_COLUMN, "-" if file_count is None else str(file_count))  # Nastavení počtu souborů
+        
+        hash_value = project.folder_hash
+        if hash_value:
+            # Zkrácení hashe pro zobrazení
+            _set_item_text(item, HASH_COLUMN, hash_value[:12] + "...")
+            item.setToolTip(HASH_COLUMN, f"Úplný hash: {hash_value}")
+        
+        _set_item_text(item, LAST_FILE_MOD_COLUMN, project.get_formatted_last_file_modified())
 
     def calculate_real_folder_sizes_action(self):
         """
@@ -1006,18 +1461,9 @@ class ProjectListView(QWidget):
         else:
             group_item = selected_item
         
-        # Načteme všechny projekty ve skupině
-        projects = []
-        for i in range(group_item.childCount()):
-            child_item = group_item.child(i)
-            project = child_item.data(0, Qt.UserRole)
-            if project:
-                projects.append((child_item, project))
-        
-        # Spustíme výpočet všech údajů pro všechny projekty ve skupině
-        self.status_label.setText("Výpočet všech údajů pro skupinu projektů...")
+        # Spustíme výpočet všech údajů pro všechny projekty ve skupině; úlohy
+        # běží na pozadí a dokončení dávky ohlásí _finish_scan_batch_task
         self.calculate_all_data(group_item)
-        self.status_label.setText("Výpočet všech údajů dokončen.")
 
     def calculate_project_hash(self, item, project):
         """
@@ -1036,24 +1482,17 @@ class ProjectListView(QWidget):
         self.status_label.setText(f"Výpočet hashe pro: {project.name}...")
         
         try:
-            # Callback pro aktualizaci stavového řádku
-            def file_callback(file_path):
-                self.status_label.setText(f"Výpočet hashe - zpracovávám: {os.path.basename(file_path)}")
-                QApplication.processEvents()  # Umožní aktualizaci UI během zpracování
-            
-            # Výpočet hashe projektu
+            # Výpočet hashe projektu s průběžnou aktualizací stavového řádku
+            file_callback = make_hash_progress_callback(self.status_label)
             hash_value = project.calculate_folder_hash(file_callback=file_callback)
             
             if hash_value:
                 # Zkrácení hashe pro zobrazení
                 short_hash = hash_value[:12] + "..."
                 
-                # Index sloupce pro hash (standardně 6)
-                hash_column = 6
-                
                 # Aktualizace dat v tabulce - hash přidáme do sloupce pro hash
-                item.setText(hash_column, short_hash)
-                item.setToolTip(hash_column, f"Úplný hash: {hash_value}")
+                item.setText(HASH_COLUMN, short_hash)
+                item.setToolTip(HASH_COLUMN, f"Úplný hash: {hash_value}")
                 
                 # Aktualizace stavového řádku
                 self.status_label.setText(f"Hash vypočítán pro: {project.name}")
@@ -1097,8 +1536,8 @@ class ProjectListView(QWidget):
         Returns:
             QWidget: Widget s legendou barev
         """
-        # Získání aktuálního tématu z ThemeManager
-        theme = ThemeManager.get_theme(ThemeManager.load_current_theme())
+        # Aktuální téma načtené při inicializaci nebo poslední změně tématu
+        theme = self._theme
         
         # Vytvoření rámečku pro legendu
         legend_frame = QFrame()
@@ -1162,11 +1601,8 @@ class ProjectListView(QWidget):
             last_file_time = project.get_last_file_modified()
             formatted_time = project.get_formatted_last_file_modified()
             
-            # Index sloupce pro poslední změnu souboru
-            last_file_mod_column = 7
-            
             # Aktualizace dat v tabulce
-            item.setText(last_file_mod_column, formatted_time)
+            item.setText(LAST_FILE_MOD_COLUMN, formatted_time)
             
             # Aktualizace stavového řádku
             self.status_label.setText(f"Datum poslední změny zjištěno pro: {project.name}")
@@ -1185,272 +1621,282 @@ class ProjectListView(QWidget):
             projects (list): Seznam projektů
             groups (list): Seznam skupin podobných projektů
         """
-        # Získání aktuálního tématu z ThemeManager
-        theme = ThemeManager.get_theme(ThemeManager.load_current_theme())
-        
         # Uložení skupin pro pozdější použití (např. pro kontextové menu)
         self.duplicate_groups = groups
         
-        # Vyčištění stromu
-        self.groups_tree.clear()
-        
         # Počítadlo celkového počtu podobných projektů
         total_duplicates = 0
         
-        # Nastavení resizeMode na první spuštění, aby byly sloupce správně zarovnány
-        for i in range(len(GROUP_COLUMNS)):
-            self.groups_tree.header().setSectionResizeMode(i, QHeaderView.ResizeToContents)
+        # Barvy z tématu a počet sloupců připravíme jen jednou
+        header_brush = self._theme_brushes["tree_header_background"]
+        similar_brush = self._theme_brushes["similar_color"]
+        column_count = len(GROUP_COLUMNS)
         
-        # Přidání skupin do stromu
-        for group_id, group in enumerate(groups):
-            # Vytvoření položky pro skupinu
-            group_item = QTreeWidgetItem(self.groups_tree)
-            
-            # Nastavení textu pro název skupiny (první sloupec)
-            group_item.setText(0, f"Skupina {group_id + 1}")
+        # Položky vytváříme bez rodiče a do stromu je vložíme najednou,
+        # strom se během plnění nepřekresluje, neřadí ani nevysílá signály
+        with self._frozen_tree() as tree:
+            # Vyčištění stromu
+            self._clear_groups_tree()
             
-            # Zvýraznění celé skupiny pomocí barvy na pozadí
-            for col in range(len(GROUP_COLUMNS)):
-                group_item.setBackground(col, QColor(theme["tree_header_background"]))
+            group_items = []
             
-            # Sečtení počtu projektů v této skupině
-            group_size = len(group)
-            total_duplicates += group_size
-            
-            # Přidání informací o projektech ve skupině
-            for idx, project_idx in enumerate(group):
-                project = projects[project_idx]
-                
-                # Vytvoření podpoložky pro projekt ve skupině
-                project_item = QTreeWidgetItem(group_item)
-                
-                # Nastavení textu pro jednotlivé sloupce
-                basename = os.path.basename(project.path)
-                project_item.setText(0, basename if basename else project.name)
-                project_item.setText(1, project.path)
-                project_item.setText(2, project.get_formatted_size())
-                project_item.setText(3, project.get_formatted_last_modified())
-                
-                # Pokud máme informace o podobnosti, zobrazíme je
-                if hasattr(project, 'similarity') and project.similarity is not None:
-                    similarity_percent = f"{project.similarity * 100:.0f}%"
-                    project_item.setText(4, similarity_percent)
-                
-                # Pokud máme informaci o počtu souborů, zobrazíme ji
-                if hasattr(project, 'real_file_count') and project.real_file_count is not None:
-                    project_item.setText(5, str(project.real_file_count))
+            # Přidání skupin do stromu
+            for group_id, group in enumerate(groups):
+                # Vytvoření položky pro skupinu
+                group_item = QTreeWidgetItem()
                 
-                # Pokud máme informaci o hashi, zobrazíme ji
-                if hasattr(project, 'folder_hash') and project.folder_hash is not None:
-                    project_item.setText(6, project.folder_hash[:8])  # Zkrácení hashe pro lepší zobrazení
+                # Nastavení textu pro název skupiny (první sloupec)
+                group_item.setText(0, f"Skupina {group_id + 1}")
                 
-                # Pokud máme informaci o poslední změně souboru, zobrazíme ji
-                if hasattr(project, 'last_file_modified') and project.last_file_modified is not None:
-                    project_item.setText(7, project.get_formatted_last_file_modified())
+                # Zvýraznění celé skupiny pomocí barvy na pozadí
+                for col in range(column_count):
+                    group_item.setBackground(col, header_brush)
                 
-                # Zvýraznění řádku projektu podobného ostatním v této skupině
-                for col in range(len(GROUP_COLUMNS)):
-                    project_item.setBackground(col, QColor(theme["similar_color"]))
+                # Sečtení počtu projektů v této skupině
+                group_size = len(group)
+                total_duplicates += group_size
                 
-                # Uložíme projekt do dat položky
-                project_item.setData(0, Qt.UserRole, project)
+                # Přidání informací o projektech ve skupině
+                project_items = []
+                for idx, project_idx in enumerate(group):
+                    project = projects[project_idx]
+                    
+                    # Vytvoření podpoložky pro projekt ve skupině
+                    project_item = ProjectTreeItem()
+                    
+                    # Nastavení textu pro jednotlivé sloupce
+                    basename = os.path.basename(project.path)
+                    project_item.setText(0, basename if basename else project.name)
+                    project_item.setText(1, project.path)
+                    project_item.setText(SIZE_COLUMN, project.get_formatted_size())
+                    project_item.setText(3, project.get_formatted_last_modified())
+                    
+                    # Pokud máme informace o podobnosti, zobrazíme je
+                    similarity = getattr(project, 'similarity', None)  # ProjectModel tento atribut sám nezakládá
+                    if similarity is not None:
+                        similarity_percent = f"{similarity * 100:.0f}%"
+                        project_item.setText(4, similarity_percent)
+                    
+                    # Pokud máme informaci o počtu souborů, zobrazíme ji
+                    if project.real_file_count is not None:
+                        project_item.setText(FILE_COUNT_COLUMN, str(project.real_file_count))
+                    
+                    # Pokud máme informaci o hashi, zobrazíme ji
+                    if project.folder_hash is not None:
+                        project_item.setText(HASH_COLUMN, project.folder_hash[:8])  # Zkrácení hashe pro lepší zobrazení
+                    
+                    # Pokud máme informaci o poslední změně souboru, zobrazíme ji
+                    if project.last_file_modified is not None:
+                        project_item.setText(LAST_FILE_MOD_COLUMN, project.get_formatted_last_file_modified())
+                    
+                    # Zvýraznění řádku projektu podobného ostatním v této skupině
+                    for col in range(column_count):
+                        project_item.setBackground(col, similar_brush)
+                    
+                    # Uložíme projekt do dat položky
+                    project_item.setData(0, Qt.UserRole, project)
+                    
+                    # Nastavení identifikátoru skupiny
+                    project_item.setData(0, Qt.UserRole + 1, group_id)
+                    
+                    project_items.append(project_item)
                 
-                # Nastavení identifikátoru skupiny
-                project_item.setData(0, Qt.UserRole + 1, group_id)
-        
-        # Přidání všech projektů do samostatné skupiny
-        self._add_all_projects_group(projects)
-        
-        # Obnovíme přirozené nastavení šířky sloupců po naplnění daty
-        self._update_column_widths()
-        
-        # Rozbalení všech skupin
-        self.groups_tree.expandAll()
+                group_item.addChildren(project_items)
+                group_items.append(group_item)
+            
+            tree.addTopLevelItems(group_items)
+            
+            # Přidání všech projektů do samostatné skupiny
+            self._add_all_projects_group(projects)
+            
+            # Šířky sloupců podle obsahu se spočítají jednou až po naplnění stromu
+            for i in range(column_count):
+                tree.header().setSectionResizeMode(i, QHeaderView.ResizeToContents)
+            
+            # Obnovíme přirozené nastavení šířky sloupců po naplnění daty
+            self._update_column_widths()
+            
+            # Rozbalení skupin podobných projektů (skupina všech projektů
+            # zůstane sbalená, dokud ji uživatel sám nerozbalí)
+            for group_item in group_items:
+                tree.expandItem(group_item)
         
         # Aktualizace stavového řádku
-        self.status_label.setText(f"Nalezeno {len(projects)} projektů, {len(groups)} " +
+        self._set_status_deferred(f"Nalezeno {len(projects)} projektů, {len(groups)} " +
                                   f"skupin podobných projektů s celkem {total_duplicates} potenciálními duplicitami.")
 
     def _add_all_projects_group(self, projects):
         """
-        Přidá skupinu se všemi projekty do stromu.
+        Přidá skupinu se všemi projekty do stromu. Skupina dostane jen zástupnou
+        položku (kvůli šipce pro rozbalení); projekty se do ní vloží až při
+        prvním rozbalení v _on_group_item_expanded.
         
         Args:
             projects (list): Seznam všech projektů
         """
-        # Získání aktuálního tématu z ThemeManager
-        theme = ThemeManager.get_theme(ThemeManager.load_current_theme())
-        
         # Vytvoření skupiny pro všechny projekty
-        all_projects_group = QTreeWidgetItem(self.groups_tree)
+        all_projects_group = QTreeWidgetItem()
         all_projects_group.setText(0, "Všechny projekty")
+        all_projects_group.setData(0, LAZY_GROUP_ROLE, ALL_PROJECTS_PLACEHOLDER)
         
         # Nastavení pozadí pro všechny sloupce
+        header_brush = self._theme_brushes["tree_header_background"]
         for col in range(len(GROUP_COLUMNS)):
-            all_projects_group.setBackground(col, QColor(theme["tree_header_background"]))
+            all_projects_group.setBackground(col, header_brush)
         
-        # Zjištění indexů sloupců pro specifické údaje
-        hash_column = GROUP_COLUMNS.index("Hash") if "Hash" in GROUP_COLUMNS else -1
-        size_column = GROUP_COLUMNS.index("Velikost") if "Velikost" in GROUP_COLUMNS else -1
-        file_count_column = GROUP_COLUMNS.index("Počet souborů") if "Počet souborů" in GROUP_COLUMNS else -1
-        last_mod_column = GROUP_COLUMNS.index("Poslední změna souboru") if "Poslední změna souboru" in GROUP_COLUMNS else -1
+        all_projects_group.addChild(QTreeWidgetItem())
+        self._lazy_all_projects = projects
+        self.groups_tree.addTopLevelItem(all_projects_group)
         
-        # Vytvoření slovníků pro seskupování projektů podle různých kritérií
-        hash_groups = {}
-        size_groups = {}
-        file_count_groups = {}
-        last_mod_groups = {}
+        # Aktualizujeme informační štítek
+        self._set_status_deferred(f"Nalezeno {len(projects)} projektů")
+    
+    def _on_group_item_expanded(self, item):
+        """
+        Při prvním rozbalení skupiny všech projektů nahradí zástupnou položku projekty.
         
-        # Naplnění slovníků podle různých kritérií
-        for project in projects:
-            # Seskupení podle hashů
-            if hasattr(project, 'folder_hash') and project.folder_hash:
-                if project.folder_hash in hash_groups:
-                    hash_groups[project.folder_hash].append(project)
-                else:
-                    hash_groups[project.folder_hash] = [project]
-            
-            # Seskupení podle velikosti
-            if hasattr(project, 'real_size') and project.real_size is not None:
-                if project.real_size in size_groups:
-                    size_groups[project.real_size].append(project)
-                else:
-                    size_groups[project.real_size] = [project]
-            
-            # Seskupení podle počtu souborů
-            if hasattr(project, 'real_file_count') and project.real_file_count is not None:
-                if project.real_file_count in file_count_groups:
-                    file_count_groups[project.real_file_count].append(project)
-                else:
-                    file_count_groups[project.real_file_count] = [project]
-            
-            # Seskupení podle data poslední změny souboru
-            if hasattr(project, 'last_file_modified') and project.last_file_modified is not None:
-                if project.last_file_modified in last_mod_groups:
-                    last_mod_groups[project.last_file_modified].append(project)
-                else:
-                    last_mod_groups[project.last_file_modified] = [project]
+        Args:
+            item: Rozbalená položka stromu
+        """
+        if item.data(0, LAZY_GROUP_ROLE) != ALL_PROJECTS_PLACEHOLDER:
+            return
+        
+        projects = self._lazy_all_projects or []
+        self._lazy_all_projects = None
+        item.setData(0, LAZY_GROUP_ROLE, None)
+        
+        with self._frozen_tree():
+            item.takeChildren()
+            self._populate_all_projects_group(item, projects)
+    
+    def _populate_all_projects_group(self, all_projects_group, projects):
+        """
+        Vloží všechny projekty do skupiny všech projektů a obarví shodné hodnoty.
+        
+        Args:
+            all_projects_group: Položka skupiny v QTreeWidget
+            projects (list): Seznam všech projektů
+        """
+        highlights = self._duplicate_highlights(projects)
         
         # Přidáme všechny projekty do skupiny
+        project_items = []
         for project in projects:
-            project_item = QTreeWidgetItem(all_projects_group)
-            
-            # Nastavíme data pro každý sloupec
-            basename = os.path.basename(project.path)
-            project_item.setText(0, basename if basename else project.name)
-            project_item.setText(1, project.path)
-            project_item.setText(2, project.get_formatted_size())
-            project_item.setText(3, project.get_formatted_last_modified())
-            
-            # Uložíme projekt do dat položky
-            project_item.setData(0, Qt.UserRole, project)
-            
-            # Obarvíme buňku s hashem pro projekty se shodným hashem
-            if hasattr(project, 'folder_hash') and project.folder_hash:
-                # Pokud existují alespoň dva projekty se stejným hashem
-                if project.folder_hash in hash_groups and len(hash_groups[project.folder_hash]) > 1:
-                    project_item.setBackground(hash_column, QColor(theme["same_hash_color"]))
-            
-            # Obarvíme buňku s velikostí pro projekty se stejnou skutečnou velikostí
-            if hasattr(project, 'real_size') and project.real_size is not None:
-                if project.real_size in size_groups and len(size_groups[project.real_size]) > 1:
-                    project_item.setBackground(size_column, QColor(theme["same_size_color"]))
-            
-            # Obarvíme buňku s počtem souborů pro projekty se stejným počtem souborů
-            if hasattr(project, 'real_file_count') and project.real_file_count is not None:
-                if project.real_file_count in file_count_groups and len(file_count_groups[project.real_file_count]) > 1:
-                    project_item.setBackground(file_count_column, QColor(theme["same_files_color"]))
-            
-            # Obarvíme buňku s datem poslední změny souboru pro projekty se stejným datem
-            if hasattr(project, 'last_file_modified') and project.last_file_modified is not None:
-                if project.last_file_modified in last_mod_groups and len(last_mod_groups[project.last_file_modified]) > 1:
-                    project_item.setBackground(last_mod_column, QColor(theme["same_date_color"]))
-            
-            # Přidáme datum poslední úpravy souboru
-            try:
-                project_item.setText(last_file_mod_column, project.get_formatted_last_file_modified())
-            except Exception as e:
-                project_item.setText(last_file_mod_column, "-")
-        
-        # Rozbalíme skupinu
-        self.groups_tree.expandItem(all_projects_group)
+            project_item = ProjectTreeItem()
+            _fill_project_row(project_item, project, highlights)
+            project_items.append(project_item)
         
-        # Aktualizujeme informační štítek
-        self.status_label.setText(f"Nalezeno {len(projects)} projektů")
+        all_projects_group.addChildren(project_items)
 
     # Přidám metodu pro aktualizaci obarvení po výpočtu
     def _update_coloring_after_calculation(self, projects):
         """
-        Aktualizuje obarvení projektů po výpočtu jejich skutečné velikosti, počtu souborů a hashů.
+        Naplánuje aktualizaci obarvení projektů po výpočtu jejich skutečné velikosti,
+        počtu souborů a hashů. Volání, která přijdou v rychlém sledu (např. dokončení
+        více dávek výpočtu), se sloučí do jediného přebarvení po RECOLOR_DELAY_MS.
         
         Args:
             projects (list): Seznam dvojic (item, projekt)
         """
-        # Získání aktuálního tématu z ThemeManager
-        theme = ThemeManager.get_theme(ThemeManager.load_current_theme())
+        self._pending_recolor.extend(projects)
+        self._recolor_timer.start()  # Běžící časovač se spustí znovu od začátku
+    
+    def _apply_pending_recolor(self):
+        """Provede naplánované přebarvení všech projektů nashromážděných od posledního."""
+        projects, self._pending_recolor = self._pending_recolor, []
+        if not projects:
+            return
+        try:
+            self._recolor_projects(projects)
+        except RuntimeError:
+            pass  # Položky mezitím zmizely ze stromu
+    
+    def _recolor_projects(self, projects):
+        """
+        Aktualizuje obarvení projektů podle jejich aktuálních hodnot.
+        Rozdělení položek podle hodnot se pro každou skupinu stromu sestaví jen
+        jednou; další výpočty pak přesunou a přebarví jen položky, jejichž
+        hodnoty se změnily.
         
-        # Zjištění indexů sloupců pro specifické údaje
-        hash_column = GROUP_COLUMNS.index("Hash") if "Hash" in GROUP_COLUMNS else -1
-        size_column = GROUP_COLUMNS.index("Velikost") if "Velikost" in GROUP_COLUMNS else -1
-        file_count_column = GROUP_COLUMNS.index("Počet souborů") if "Počet souborů" in GROUP_COLUMNS else -1
-        last_mod_column = GROUP_COLUMNS.index("Poslední změna souboru") if "Poslední změna souboru" in GROUP_COLUMNS else -1
+        Args:
+            projects (list): Seznam dvojic (item, projekt)
+        """
+        # Nejprve se jen zjistí, které buňky je třeba přebarvit. Všechna kritéria
+        # položky se zpracují v jediném průchodu přes projekty.
+        writes = []
+        group_item = value_buckets = None
+        for item, project in projects:
+            # Dávka obvykle pochází z jediné skupiny - rozdělení se hledá
+            # jen tehdy, když se skupina oproti předchozí položce změní
+            parent = item.parent()
+            if value_buckets is None or parent is not group_item:
+                group_item = parent
+                value_buckets = self._get_value_buckets(parent, writes)
+            
+            for buckets in value_buckets:
+                buckets.update(item, project, writes)
+        
+        # Pro každou buňku platí poslední zaznamenaný štětec
+        final_brushes = {}
+        for item, column, brush in writes:
+            final_brushes[item, column] = brush
+        
+        # Zrušení zvýraznění (NO_BRUSH) se týká jen buněk obarvených zvýrazněním
+        # shodných hodnot a vrací jim pozadí řádku (sloupec 0) - zvýraznění
+        # podobnosti celého řádku tak zůstane zachováno
+        highlight_brushes = {buckets.column: buckets.brush for buckets in value_buckets or ()}
+        changes = []
+        for (item, column), brush in final_brushes.items():
+            current = item.background(column)
+            if brush == NO_BRUSH:
+                if current != highlight_brushes[column]:
+                    continue
+                brush = item.background(0)
+            if current != brush:
+                changes.append((item, column, brush))
+        
+        # Žádná hodnota se nezačala ani nepřestala shodovat - strom se vůbec
+        # nemusí zmrazovat a překreslovat
+        if not changes:
+            return
         
-        # Vytvoření slovníků pro seskupování projektů podle různých kritérií
-        hash_groups = {}
-        size_groups = {}
-        file_count_groups = {}
-        last_mod_groups = {}
+        # Strom se během obarvování nepřekresluje; změny se vykreslí najednou
+        with self._frozen_tree():
+            for item, column, brush in changes:
+                item.setBackground(column, brush)
+    
+    def _get_value_buckets(self, group_item, writes):
+        """
+        Vrací rozdělení položek skupiny stromu podle kritérií zvýraznění shodných
+        hodnot. Při prvním použití pro skupinu ho sestaví ze všech jejích projektů.
         
-        # Naplnění slovníků podle různých kritérií
-        for item, project in projects:
-            # Seskupení podle hashů
-            if hasattr(project, 'folder_hash') and project.folder_hash is not None:
-                if project.folder_hash in hash_groups:
-                    hash_groups[project.folder_hash].append((item, project))
-                else:
-                    hash_groups[project.folder_hash] = [(item, project)]
-            
-            # Seskupení podle velikosti
-            if hasattr(project, 'real_size') and project.real_size is not None:
-                if project.real_size in size_groups:
-                    size_groups[project.real_size].append((item, project))
-                else:
-                    size_groups[project.real_size] = [(item, project)]
-            
-            # Seskupení podle počtu souborů
-            if hasattr(project, 'real_file_count') and project.real_file_count is not None:
-                if project.real_file_count in file_count_groups:
-                    file_count_groups[project.real_file_count].append((item, project))
-                else:
-                    file_count_groups[project.real_file_count] = [(item, project)]
+        Args:
+            group_item: Položka skupiny v QTreeWidget (None pro položky nejvyšší úrovně)
+            writes (list): Seznam, do kterého se přidají změny obarvení při sestavení
             
-            # Seskupení podle data poslední změny souboru
-            if hasattr(project, 'last_file_modified') and project.last_file_modified is not None:
-                if project.last_file_modified in last_mod_groups:
-                    last_mod_groups[project.last_file_modified].append((item, project))
-                else:
-                    last_mod_groups[project.last_file_modified] = [(item, project)]
-        
-        # Obarvíme buňky s hashem pro projekty se shodným hashem (zelená)
-        for hash_val, items_projects in hash_groups.items():
-            if len(items_projects) > 1:  # Pouze pokud existuje více projektů se stejným hashem
-                for item, _ in items_projects:
-                    item.setBackground(hash_column, QColor(theme["same_hash_color"]))
-        
-        # Obarvíme buňky s velikostí pro projekty se stejnou skutečnou velikostí (oranžová)
-        for size, items_projects in size_groups.items():
-            if len(items_projects) > 1:  # Pouze pokud existuje více projektů se stejnou velikostí
-                for item, _ in items_projects:
-                    item.setBackground(size_column, QColor(theme["same_size_color"]))
-        
-        # Obarvíme buňky s počtem souborů pro projekty se stejným počtem souborů (modrá)
-        for count, items_projects in file_count_groups.items():
-            if len(items_projects) > 1:  # Pouze pokud existuje více projektů se stejným počtem souborů
-                for item, _ in items_projects:
-                    item.setBackground(file_count_column, QColor(theme["same_files_color"]))
-        
-        # Obarvíme buňky s datem poslední změny souboru pro projekty se stejným datem (fialová)
-        for date, items_projects in last_mod_groups.items():
-            if len(items_projects) > 1:  # Pouze pokud existuje více projektů se stejným datem
-                for item, _ in items_projects:
-                    item.setBackground(last_mod_column, QColor(theme["same_date_color"]))
\ No newline at end of file
+        Returns:
+            tuple: Objekty ValueBuckets pro hash, velikost, počet souborů a datum
+        """
+        value_buckets = self._value_buckets.get(group_item)
+        if value_buckets is not None:
+            return value_buckets
+        
+        value_buckets = (
+            ValueBuckets("folder_hash", HASH_COLUMN, self._theme_brushes["same_hash_color"]),
+            ValueBuckets("real_size", SIZE_COLUMN, self._theme_brushes["same_size_color"]),
+            ValueBuckets("real_file_count", FILE_COUNT_COLUMN, self._theme_brushes["same_files_color"]),
+            ValueBuckets("last_file_modified", LAST_FILE_MOD_COLUMN, self._theme_brushes["same_date_color"]),
+        )
+        self._value_buckets[group_item] = value_buckets
+        
+        # Zařadíme všechny projekty skupiny, aby se porovnávaly i s projekty,
+        # které se tentokrát nepočítaly
+        if group_item is not None:
+            for i in range(group_item.childCount()):
+                child_item = group_item.child(i)
+                project = child_item.data(0, Qt.UserRole)
+                if project:
+                    for buckets in value_buckets:
+                        buckets.update(child_item, project, writes)
+        
+        return value_buckets
\ No newline at end of file
@@ -7,7 +7,7 @@ Dialog pro nastavení aplikace Python Project Finder.
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, 
     QLabel, QLineEdit, QCheckBox, QDialogButtonBox,
-    QListWidget, QListWidgetItem, QPushButton, QGroupBox
+    QListWidget, QPushButton, QGroupBox, QInputDialog
 )
 from PySide6.QtCore import Qt, QSettings
 from PySide6.QtGui import QDoubleValidator
@@ -18,6 +18,10 @@ from config import IGNORED_DIRECTORIES, PYTHON_EXTENSIONS, SIMILARITY_THRESHOLD
 class SettingsDialog(QDialog):
     """Dialog pro nastavení aplikace."""
     
+    # Nastavení načtené z QSettings, sdílené všemi instancemi dialogu.
+    # Načítá se při prvním otevření dialogu a aktualizuje se při uložení.
+    _cached_settings = None
+    
     def __init__(self, parent=None):
         """Inicializace dialogu."""
         super().__init__(parent)
@@ -27,30 +31,40 @@ class SettingsDialog(QDialog):
         
         # Načtení aktuálního nastavení
         self.settings = QSettings("mastnacek", "PythonProjectFinder")
+        cached = self._load_settings()
         
-        # Ignorované adresáře
-        self.ignored_dirs = self.settings.value(
-            "finder/ignored_dirs", 
-            IGNORED_DIRECTORIES, 
-            list
-        )
+        # Ignorované adresáře a přípony souborů - dialog seznamy upravuje,
+        # proto pracuje s kopiemi (zrušení dialogu nesmí změnit uložené hodnoty)
+        self.ignored_dirs = list(cached["ignored_dirs"])
+        self.python_extensions = list(cached["python_extensions"])
         
-        # Přípony souborů
-        self.python_extensions = self.settings.value(
-            "finder/python_extensions", 
-            PYTHON_EXTENSIONS, 
-            list
-        )
+        # Množiny pro rychlý test, zda položka už v seznamu je (seznamy drží pořadí)
+        self._ignored_dirs_set = set(self.ignored_dirs)
+        self._python_extensions_set = set(self.python_extensions)
         
         # Práh podobnosti
-        self.similarity_threshold = self.settings.value(
-            "finder/similarity_threshold", 
-            SIMILARITY_THRESHOLD, 
-            float
-        )
+        self.similarity_threshold = cached["similarity_threshold"]
         
         self.init_ui()
     
+    def _load_settings(self):
+        """
+        Vrací nastavení vyhledávání. Z QSettings se čte jen při prvním volání,
+        další otevření dialogu použijí hodnoty uložené ve třídě.
+        
+        Returns:
+            dict: Slovník s nastaveními
+        """
+        if SettingsDialog._cached_settings is None:
+            self.settings.beginGroup("finder")
+            SettingsDialog._cached_settings = {
+                "ignored_dirs": self.settings.value("ignored_dirs", IGNORED_DIRECTORIES, list),
+                "python_extensions": self.settings.value("python_extensions", PYTHON_EXTENSIONS, list),
+                "similarity_threshold": self.settings.value("similarity_threshold", SIMILARITY_THRESHOLD, float),
+            }
+            self.settings.endGroup()
+        return SettingsDialog._cached_settings
+    
     def init_ui(self):
         """Inicializace uživatelského rozhraní dialogu."""
         layout = QVBoxLayout(self)
@@ -61,8 +75,7 @@ class SettingsDialog(QDialog):
         
         self.ignored_list = QListWidget()
         self.ignored_list.setSelectionMode(QListWidget.SingleSelection)
-        for directory in self.ignored_dirs:
-            QListWidgetItem(directory, self.ignored_list)
+        self.ignored_list.addItems(self.ignored_dirs)
         
         ignored_layout.addWidget(self.ignored_list)
         
@@ -84,8 +97,7 @@ class SettingsDialog(QDialog):
         
         self.extensions_list = QListWidget()
         self.extensions_list.setSelectionMode(QListWidget.SingleSelection)
-        for extension in self.python_extensions:
-            QListWidgetItem(extension, self.extensions_list)
+        self.extensions_list.addItems(self.python_extensions)
         
         extensions_layout.addWidget(self.extensions_list)
         
@@ -121,9 +133,10 @@ class SettingsDialog(QDialog):
         """Přidá nový ignorovaný adresář do seznamu."""
         text, ok = self.get_text_input("Přidat ignorovaný adresář", "Název adresáře:")
         if ok and text:
-            if text not in self.ignored_dirs:
-                QListWidgetItem(text, self.ignored_list)
+            if text not in self._ignored_dirs_set:
+                self._ignored_dirs_set.add(text)
                 self.ignored_dirs.append(text)
+                self.ignored_list.addItem(text)
     
     def remove_ignored_dir(self):
         """Odebere vybraný ignorovaný adresář ze seznamu."""
@@ -137,6 +150,7 @@ class SettingsDialog(QDialog):
         row = self.ignored_list.row(item)
         self.ignored_list.takeItem(row)
         self.ignored_dirs.remove(directory)
+        self._ignored_dirs_set.discard(directory)
     
     def add_extension(self):
         """Přidá novou příponu souboru do seznamu."""
@@ -145,9 +159,10 @@ class SettingsDialog(QDialog):
             if not text.startswith('.'):
                 text = '.' + text
             
-            if text not in self.python_extensions:
-                QListWidgetItem(text, self.extensions_list)
+            if text not in self._python_extensions_set:
+                self._python_extensions_set.add(text)
                 self.python_extensions.append(text)
+                self.extensions_list.addItem(text)
     
     def remove_extension(self):
         """Odebere vybranou příponu souboru ze seznamu."""
@@ -161,10 +176,13 @@ class SettingsDialog(QDialog):
         row = self.extensions_list.row(item)
         self.extensions_list.takeItem(row)
         self.python_extensions.remove(extension)
+        self._python_extensions_set.discard(extension)
     
     def get_text_input(self, title, label):
         """
         Zobrazí dialog pro zadání textu.
+        Používá hotový QInputDialog, takže se při každém volání nesestavuje
+        vlastní dialog s layouty a tlačítky.
         
         Args:
             title (str): Titulek dialogu
@@ -173,23 +191,7 @@ class SettingsDialog(QDialog):
         Returns:
             tuple: (zadaný_text, stav_ok)
         """
-        dialog = QDialog(self)
-        dialog.setWindowTitle(title)
-        
-        layout = QVBoxLayout(dialog)
-        
-        form_layout = QFormLayout()
-        text_edit = QLineEdit()
-        form_layout.addRow(label, text_edit)
-        layout.addLayout(form_layout)
-        
-        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        button_box.accepted.connect(dialog.accept)
-        button_box.rejected.connect(dialog.reject)
-        layout.addWidget(button_box)
-        
-        result = dialog.exec()
-        return text_edit.text(), result == QDialog.Accepted
+        return QInputDialog.getText(self, title, label)
     
     def accept(self):
         """Zpracování dialogu při potvrzení."""
@@ -204,9 +206,18 @@ class SettingsDialog(QDialog):
             self.similarity_threshold = SIMILARITY_THRESHOLD
         
         # Uložení nastavení do QSettings
-        self.settings.setValue("finder/ignored_dirs", self.ignored_dirs)
-        self.settings.setValue("finder/python_extensions", self.python_extensions)
-        self.settings.setValue("finder/similarity_threshold", self.similarity_threshold)
+        self.settings.beginGroup("finder")
+        self.settings.setValue("ignored_dirs", self.ignored_dirs)
+        self.settings.setValue("python_extensions", self.python_extensions)
+        self.settings.setValue("similarity_threshold", self.similarity_threshold)
+        self.settings.endGroup()
+        
+        # Uložené hodnoty použije i příští otevření dialogu
+        SettingsDialog._cached_settings = {
+            "ignored_dirs": list(self.ignored_dirs),
+            "python_extensions": list(self.python_extensions),
+            "similarity_threshold": self.similarity_threshold,
+        }
         
         super().accept()
     
@@ -215,10 +226,11 @@ class SettingsDialog(QDialog):
         Vrací aktuální nastavení dialogu.
         
         Returns:
-            dict: Slovník s nastaveními
+            dict: Slovník s nastaveními (ignorované adresáře jako frozenset
+                  pro rychlé testy při procházení složek)
         """
         return {
-            "ignored_dirs": self.ignored_dirs,
+            "ignored_dirs": frozenset(self._ignored_dirs_set),
             "python_extensions": self.python_extensions,
             "similarity_threshold": self.similarity_threshold
         } 
\ No newline at end of file